@@ -1,6 +1,8 @@
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Final
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Tuple
 from dotenv import load_dotenv, set_key
 
 from civitai_models_manager.modules.helpers import feedback_message
@@ -27,22 +29,21 @@ def validate_directory(path: str) -> str:
     :param path: The directory path to validate.
     :return: The validated directory path.
     """
-    dir_path = Path(path).expanduser().resolve()
-    if not dir_path.exists():
-        try:
-            dir_path.mkdir(parents=True)
-            feedback_message(f"Created directory: {dir_path}", "info")
-        except Exception as e:
-            feedback_message(f"Error creating directory: {e}", "error")
-            return validate_directory(
-                get_required_input("Please enter a valid directory path: ")
-            )
-    elif not dir_path.is_dir():
-        feedback_message(f"{dir_path} is not a directory.", "error")
-        return validate_directory(
-            get_required_input("Please enter a valid directory path: ")
-        )
-    return str(dir_path)
+    while True:
+        dir_path = Path(path).expanduser().resolve()
+        if not dir_path.exists():
+            try:
+                dir_path.mkdir(parents=True)
+                feedback_message(f"Created directory: {dir_path}", "info")
+                return str(dir_path)
+            except Exception as e:
+                feedback_message(f"Error creating directory: {e}", "error")
+        elif not dir_path.is_dir():
+            feedback_message(f"{dir_path} is not a directory.", "error")
+        else:
+            return str(dir_path)
+        # Ask again in place rather than recursing once per bad answer
+        path = get_required_input("Please enter a valid directory path: ")
 
 
 def create_env_file(env_path: Path) -> None:
@@ -68,6 +69,26 @@ def create_env_file(env_path: Path) -> None:
     feedback_message(f".env file created successfully at {env_path}", "info")
 
 
+# Potential .env file locations, common ones first, keyed by sys.platform
+_ENV_LOCATIONS: Final[Dict[str, Tuple[str, ...]]] = {
+    "common": (
+        "~/.config/civitai-model-manager/.env",
+        "~/.civitai-model-manager/.env",
+        "~/.env",
+        "./.env",
+    ),
+    "win32": (
+        "~/AppData/Roaming/civitai-model-manager/.env",
+        "~/Documents/civitai-model-manager/.env",
+    ),
+    "linux": ("~/.local/share/civitai-model-manager/.env",),
+    "darwin": ("~/Library/Application Support/civitai-model-manager/.env",),
+}
+_ENV_SEARCH_PATHS: Final = _ENV_LOCATIONS["common"] + _ENV_LOCATIONS.get(
+    sys.platform, ()
+)
+
+
 def load_environment_variables() -> None:
     """
     Load environment variables from a .env file or create one if not found.
@@ -79,36 +100,9 @@ def load_environment_variables() -> None:
     :raises FileNotFoundError: If the .env file is not found in any of the
                                searched locations and user chooses not to create one.
     """
-    # Define potential .env file locations
-    env_locations: Dict[str, List[str]] = {
-        "common": [
-            "~/.config/civitai-model-manager/.env",
-            "~/.civitai-model-manager/.env",
-            "~/.env",
-            "./.env",
-        ],
-        "Windows": [
-            "~/AppData/Roaming/civitai-model-manager/.env",
-            "~/Documents/civitai-model-manager/.env",
-        ],
-        "Linux": [
-            "~/.local/share/civitai-model-manager/.env",
-        ],
-        "Darwin": [
-            "~/Library/Application Support/civitai-model-manager/.env",
-        ],
-    }
-
-    # Get the current operating system
-    system_platform = os.name
-
-    # Combine common locations with OS-specific locations
-    search_paths = env_locations["common"] + env_locations.get(system_platform, [])
-
-    # Search for .env file
-    for path in search_paths:
-        env_path = Path(path).expanduser().resolve()
-        if env_path.is_file():
+    for path in _ENV_SEARCH_PATHS:
+        env_path = os.path.expanduser(path)
+        if os.path.isfile(env_path):
             load_dotenv(env_path)
             # feedback_message(f"Loaded environment variables from {env_path}", "info")
             return
@@ -117,7 +111,7 @@ def load_environment_variables() -> None:
     feedback_message(
         ".env file not found in any of the following locations:", "warning"
     )
-    for path in search_paths:
+    for path in _ENV_SEARCH_PATHS:
         feedback_message(f"  - {Path(path).expanduser()}", "info")
 
     create_new = (
@@ -136,56 +130,31 @@ def load_environment_variables() -> None:
         raise FileNotFoundError("No .env file found and user chose not to create one.")
 
 
-# Usage
-load_environment_variables()
-
-# Set environment variables
-os.environ["MODELS_DIR"] = os.getenv("MODELS_DIR", "")
-os.environ["CIVITAI_TOKEN"] = os.getenv("CIVITAI_TOKEN", "")
-os.environ["OLLAMA_MODEL"] = os.getenv("OLLAMA_MODEL", "")
-os.environ["OLLAMA_API_BASE"] = os.getenv("OLLAMA_API_BASE", "")
-os.environ["TEMP"] = os.getenv("TEMP", "0.4")
-os.environ["TOP_P"] = os.getenv("TOP_P", "0.3")
-os.environ["HTML_OUT"] = os.getenv("HTML_OUT", "False")
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY", "")
-os.environ["OPENAI_MODEL"] = os.getenv("OPENAI_MODEL", "")
-os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY", "")
-os.environ["GROQ_MODEL"] = os.getenv("GROQ_MODEL", "")
-
-# Define constants
-MODELS_DIR: Final = os.environ["MODELS_DIR"]
-CIVITAI_TOKEN: Final = os.environ["CIVITAI_TOKEN"]
-OLLAMA_MODEL: Final = os.environ["OLLAMA_MODEL"]
-OLLAMA_API_BASE: Final = os.environ["OLLAMA_API_BASE"]
-TEMP: Final = os.environ["TEMP"]
-TOP_P: Final = os.environ["TOP_P"]
-HTML_OUT: Final = os.environ["HTML_OUT"].lower() == "true"
-OPENAI_API_KEY: Final = os.environ["OPENAI_API_KEY"]
-OPENAI_MODEL: Final = os.environ["OPENAI_MODEL"]
-GROQ_API_KEY: Final = os.environ["GROQ_API_KEY"]
-GROQ_MODEL: Final = os.environ["GROQ_MODEL"]
-
 CIVITAI_MODELS: Final = "https://civitai.com/api/v1/models"
 CIVITAI_IMAGES: Final = "https://civitai.com/api/v1/images"
 CIVITAI_VERSIONS: Final = "https://civitai.com/api/v1/model-versions"
 CIVITAI_DOWNLOAD: Final = "https://civitai.com/api/download/models"
 
-TYPES: Final = {
-    "Checkpoint": "checkpoints",
-    "TextualInversion": "embeddings",
-    "Hypernetwork": "hypernetworks",
-    "AestheticGradient": "aesthetic_embeddings",
-    "LORA": "loras",
-    "LoCon": "models/Lora",
-    "Controlnet": "controlnet",
-    "Poses": "poses",
-    "Upscaler": "esrgan",
-    "MotionModule": "motion_module",
-    "VAE": "VAE",
-    "Wildcards": "wildcards",
-    "Workflows": "workflows",
-    "Other": "other",
-}
+TYPES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "Checkpoint": "checkpoints",
+        "TextualInversion": "embeddings",
+        "Hypernetwork": "hypernetworks",
+        "AestheticGradient": "aesthetic_embeddings",
+        "LORA": "loras",
+        "LoCon": "models/Lora",
+        "Controlnet": "controlnet",
+        "Poses": "poses",
+        "Upscaler": "esrgan",
+        "MotionModule": "motion_module",
+        "VAE": "VAE",
+        "Wildcards": "wildcards",
+        "Workflows": "workflows",
+        "Other": "other",
+    }
+)
+# Menu order for the type prompts, built once rather than per prompt
+TYPE_KEYS: Final = tuple(TYPES)
 
 FILE_TYPES = (".safetensors", ".pt", ".pth", ".ckpt")
 MODEL_TYPES: Final = [
@@ -200,37 +169,103 @@ MODEL_TYPES: Final = [
     "Other",
 ]
 
-OLLAMA_OPTIONS: Final = {
-    "model": os.getenv("OLLAMA_MODEL", ""),
-    "api_base": os.getenv("OLLAMA_API_BASE", ""),
-    "temperature": os.getenv("TEMP", 0.9),
-    "top_p": os.getenv("TOP_P", 0.3),
-    "html_output": os.getenv("HTML_OUT", False),
-    "system_template": (
-        "You are an expert in giving detailed explanations of description you are provided. Do not present it "
-        "like an update log. Make sure to explains the full description in a clear and concise manner. "
-        "The description is provided by the CivitAI API and not written by the user, so don't make recommendations "
-        "on how to improve the description, just be detailed, clear and thorough about the provided content. "
-        "Include information on recommended settings and tip if they appear in the description:\n "
-        "- Tips on Usage\n"
-        "- Sampling method\n"
-        "- Schedule type\n"
-        "- Sampling steps\n"
-        "- CFG Scale\n"
-        "DO NOT OFFER ADVICE ON HOW TO IMPROVE THE DESCRIPTION!!"
-        "Return the description in Markdown format.\n\n"
-        "You will find the description below: \n\n"
-    ),
-}
+SYSTEM_TEMPLATE: Final = (
+    "You are an expert in giving detailed explanations of description you are provided. Do not present it "
+    "like an update log. Make sure to explains the full description in a clear and concise manner. "
+    "The description is provided by the CivitAI API and not written by the user, so don't make recommendations "
+    "on how to improve the description, just be detailed, clear and thorough about the provided content. "
+    "Include information on recommended settings and tip if they appear in the description:\n "
+    "- Tips on Usage\n"
+    "- Sampling method\n"
+    "- Schedule type\n"
+    "- Sampling steps\n"
+    "- CFG Scale\n"
+    "DO NOT OFFER ADVICE ON HOW TO IMPROVE THE DESCRIPTION!!"
+    "Return the description in Markdown format.\n\n"
+    "You will find the description below: \n\n"
+)
+
+# Settings read from the .env file. They are loaded on first access so
+# commands such as --help never search for or prompt about a .env file.
+_LAZY_SETTINGS: Final = frozenset(
+    {
+        "MODELS_DIR",
+        "CIVITAI_TOKEN",
+        "OLLAMA_MODEL",
+        "OLLAMA_API_BASE",
+        "TEMP",
+        "TOP_P",
+        "HTML_OUT",
+        "OPENAI_API_KEY",
+        "OPENAI_MODEL",
+        "GROQ_API_KEY",
+        "GROQ_MODEL",
+        "OLLAMA_OPTIONS",
+        "OPENAI_OPTIONS",
+        "GROQ_OPTIONS",
+    }
+)
+# Settings read from the environment, with their defaults
+_ENV_DEFAULTS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "MODELS_DIR": "",
+        "CIVITAI_TOKEN": "",
+        "OLLAMA_MODEL": "",
+        "OLLAMA_API_BASE": "",
+        "TEMP": "0.4",
+        "TOP_P": "0.3",
+        "HTML_OUT": "False",
+        "OPENAI_API_KEY": "",
+        "OPENAI_MODEL": "",
+        "GROQ_API_KEY": "",
+        "GROQ_MODEL": "",
+    }
+)
+_loaded = False
 
-OPENAI_OPTIONS = {
-    "api_key": os.getenv("OPENAI_API_KEY", ""),
-    "model": os.getenv("OPENAI_MODEL", ""),
-    "system_template": OLLAMA_OPTIONS["system_template"],
-}
 
-GROQ_OPTIONS = {
-    "api_key": os.getenv("GROQ_API_KEY", ""),
-    "model": os.getenv("GROQ_MODEL", ""),
-    "system_template": OLLAMA_OPTIONS["system_template"],
-}
+def _ensure_loaded() -> None:
+    """
+    Load the .env file and define the settings derived from it, once.
+    """
+    global _loaded
+    if _loaded:
+        return
+
+    load_environment_variables()
+
+    # Read each setting once, export it for the modules that use os.environ,
+    # and derive the option dicts from the same values
+    env = {name: os.getenv(name, default) for name, default in _ENV_DEFAULTS.items()}
+    os.environ.update(env)
+
+    globals().update(
+        env,
+        HTML_OUT=env["HTML_OUT"].lower() == "true",
+        OLLAMA_OPTIONS={
+            "model": env["OLLAMA_MODEL"],
+            "api_base": env["OLLAMA_API_BASE"],
+            "temperature": env["TEMP"],
+            "top_p": env["TOP_P"],
+            "html_output": env["HTML_OUT"],
+            "system_template": SYSTEM_TEMPLATE,
+        },
+        OPENAI_OPTIONS={
+            "api_key": env["OPENAI_API_KEY"],
+            "model": env["OPENAI_MODEL"],
+            "system_template": SYSTEM_TEMPLATE,
+        },
+        GROQ_OPTIONS={
+            "api_key": env["GROQ_API_KEY"],
+            "model": env["GROQ_MODEL"],
+            "system_template": SYSTEM_TEMPLATE,
+        },
+    )
+    _loaded = True
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SETTINGS:
+        _ensure_loaded()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,37 +13,36 @@
 # ]
 # ///
 
+import os
+import sys
 import typer
 
 from typing import Optional
 from civitai_models_manager.__version__ import __version__
 from civitai_models_manager import (
-    MODELS_DIR,
-    CIVITAI_TOKEN,
     CIVITAI_MODELS,
     CIVITAI_DOWNLOAD,
     CIVITAI_VERSIONS,
     TYPES,
     FILE_TYPES,
-    OLLAMA_OPTIONS,
-    OPENAI_OPTIONS,
-    GROQ_OPTIONS,
 )
 from typing import List
 from .modules.helpers import feedback_message
-from .modules.tools import sanity_check_cli, about_cli
-from .modules.stats import inspect_models_cli
-from .modules.details import get_model_details_cli
-from .modules.list import list_models_cli, local_search_cli
-from .modules.download import download_model_cli
-from .modules.ai import explain_model_cli
-from .modules.search import search_cli_sync
-from .modules.remove import remove_models_cli
+
+# Command modules, and the .env backed settings, are imported inside each
+# command so a run only loads what the dispatched command needs.
 # from .modules.create import create_image_cli
 
-from rich.traceback import install
 
-install()
+def _rich_excepthook(*exc_info) -> None:
+    """Install rich tracebacks on the first uncaught error rather than at import."""
+    from rich.traceback import install
+
+    install()
+    sys.excepthook(*exc_info)
+
+
+sys.excepthook = _rich_excepthook
 
 """
 ====================================================================
@@ -68,6 +67,7 @@ Options:
     [stats] details                       List available models along with their types and paths.
     [stats] overview                      Stats on the parent models directory.
     [tools] sanity-check                  Check to see if the app is ready to run.
+    [tools] clear-cache                   Delete cached API responses and summaries.
     search TEXT --query                   Search for models by query, tag, or types, which are optional via the API.
     remove                                Remove specified models from local storage.
     --help                                Show this message and exit.
@@ -76,12 +76,13 @@ Examples:
 
 $ civitai-models about [about] [readme]
 $ civitai-models details 12345 [desc] [images]
-$ civitai-models download 54321 [--select]
+$ civitai-models download 54321 [--select] [--file ids.txt] [--yes]
 $ civitai-models remove
 $ civitai-models search  "text" [--tag "tag1"] [--types "Checkpoint"] [--limit 20] [--sort "Highest Rated"] [--period "AllTime"]
 $ civitai-models stats [overview] [details]
-$ civitai-models tools explain 12345 [--service ollama]
+$ civitai-models tools explain 12345 [67890] [--service ollama]
 $ civitai-models tools sanity-check
+$ civitai-models tools clear-cache
 
 """
 
@@ -89,7 +90,7 @@ __version__ = __version__
 
 __all__ = ["civitai_cli"]
 
-civitai_cli = typer.Typer()
+civitai_cli = typer.Typer(pretty_exceptions_enable=False)
 about_group = typer.Typer()
 stats_group = typer.Typer()
 search_group = typer.Typer()
@@ -97,6 +98,34 @@ create_group = typer.Typer()
 tools_group = typer.Typer()
 
 
+@civitai_cli.callback(invoke_without_command=True)
+def civitai_callback(
+    ctx: typer.Context,
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Revalidate every CivitAI response with the API."
+    ),
+    cache_ttl: Optional[int] = typer.Option(
+        None,
+        "--cache-ttl",
+        help="Seconds a cached CivitAI response is reused without asking the API.",
+    ),
+):
+    """
+    CLI tool for managing AI models from the CivitAI platform.
+    """
+    if no_cache:
+        cache_ttl = 0
+    if cache_ttl is not None:
+        # Read by modules.cache; takes precedence over the .env value
+        os.environ["CIVITAI_CACHE_TTL"] = str(cache_ttl)
+
+    # A bare invocation shows the help and exits 0, as it always has;
+    # no_args_is_help would exit 2 and break scripts calling it
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
 civitai_cli.add_typer(
     about_group,
     name="about",
@@ -145,6 +174,8 @@ def search_models_command(
     sort: str = typer.Option("Highest Rated", help="Sort order for results"),
     period: str = typer.Option("AllTime", help="Time period for results"),
 ):
+    from .modules.search import search_cli_sync
+
     search_cli_sync(
         query,
         tag,
@@ -161,24 +192,30 @@ def search_models_command(
 def local_search_command(
     query: str = typer.Argument("", help="Search query"),
 ):
+    from civitai_models_manager import MODELS_DIR
+    from .modules.list import local_search_cli
+
     return local_search_cli(query, MODELS_DIR=MODELS_DIR, FILE_TYPES=FILE_TYPES)
 
 
 @tools_group.command(
     "explain",
-    help="Get a summary of a specific model by ID using the specified service (default is Ollama).",
+    help="Get a summary of specific models by ID using the specified service (default is Ollama).",
 )
 def explain_model_command(
-    identifier: str = typer.Argument("", help="The ID of the model"),
+    identifiers: List[str] = typer.Argument(..., help="The IDs of the models"),
     service: str = typer.Option("ollama", "-s", help="The specified service to use"),
 ):
     """
-    Get a summary of a specific model by ID using the specified service (default is Ollama).
-    :param identifier: The ID of the model.
+    Get a summary of specific models by ID using the specified service (default is Ollama).
+    :param identifiers: The IDs of the models.
     :param service: The specified service to use (default is "ollama").
     """
+    from civitai_models_manager import OLLAMA_OPTIONS, OPENAI_OPTIONS, GROQ_OPTIONS
+    from .modules.ai import explain_model_cli
+
     explain_model_cli(
-        identifier,
+        identifiers,
         service,
         CIVITAI_MODELS=CIVITAI_MODELS,
         CIVITAI_VERSIONS=CIVITAI_VERSIONS,
@@ -194,6 +231,9 @@ def sanity_check_command():
     Check to see if the app is ready to run.
     :return: The result of the sanity check.
     """
+    from civitai_models_manager import OLLAMA_OPTIONS, OPENAI_OPTIONS, GROQ_OPTIONS
+    from .modules.tools import sanity_check_cli
+
     return sanity_check_cli(
         CIVITAI_MODELS=CIVITAI_MODELS,
         CIVITAI_VERSIONS=CIVITAI_VERSIONS,
@@ -203,6 +243,18 @@ def sanity_check_command():
     )
 
 
+@tools_group.command("clear-cache", help="Delete cached API responses and summaries.")
+def clear_cache_command():
+    """
+    Delete cached API responses and summaries.
+    :return: None
+    """
+    from .modules.cache import clear_cache
+
+    removed = clear_cache()
+    feedback_message(f"Removed {removed} cached file(s).", "info")
+
+
 @create_group.command("image", help="Generate a image on the CivitAI platform.")
 def create_image_command(
     model: int = typer.Argument(0, help="The ID of the model"),
@@ -237,6 +289,8 @@ def list_models_command():
     List available models along with their types and paths.
     :return: The list of available models.
     """
+    from .modules.list import list_models_cli
+
     return list_models_cli()
 
 
@@ -246,6 +300,9 @@ def stats_command():
     Stats on the parent models directory.
     :return: The stats on the parent models directory.
     """
+    from civitai_models_manager import MODELS_DIR
+    from .modules.stats import inspect_models_cli
+
     return inspect_models_cli(MODELS_DIR=MODELS_DIR)
 
 
@@ -253,7 +310,9 @@ def stats_command():
     "details", help="Get detailed information about a specific model by ID."
 )
 def details_command(
-    identifier: str = typer.Argument("", help="The ID of the model"),
+    identifier: str = typer.Argument(
+        "", help="The ID of the model, or several comma separated IDs"
+    ),
     desc: bool = typer.Option(
         False, "--desc", "-d", help="The description of the model"
     ),
@@ -263,11 +322,13 @@ def details_command(
 ):
     """
     Get detailed information about a specific model by ID.
-    :param identifier: The ID of the model.
+    :param identifier: The ID of the model, or several comma separated IDs.
     :param desc: The description of the model.
     :param images: The images of the model.
     :return: The detailed information about the model.
     """
+    from .modules.details import get_model_details_cli
+
     return get_model_details_cli(
         identifier,
         desc,
@@ -279,30 +340,55 @@ def details_command(
 
 @civitai_cli.command("download", help="Download up to 3 specific model variants by ID.")
 def download_model_command(
-    identifiers: List[str] = typer.Argument(
-        ..., help="The IDs of the models to download (up to 3)"
+    identifiers: Optional[List[str]] = typer.Argument(
+        None, help="The IDs of the models to download (up to 3)"
     ),
     select: bool = typer.Option(
         False, "--select", "-s", help="Enable version selection for each model"
     ),
+    file: Optional[str] = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Also download every ID listed in this file, one per line (no limit)",
+    ),
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Upgrade existing models without asking"
+    ),
 ):
     """
     Download up to 3 specific model variants by ID.
     :param identifiers: The IDs of the models to download (up to 3).
     :param select: Enable version selection for each model.
+    :param file: A file of model IDs, one per line, downloaded in the same run.
+    :param yes: Upgrade existing models without asking.
     :return: None
     """
+    from civitai_models_manager import MODELS_DIR, CIVITAI_TOKEN
+    from .modules.download import download_model_cli
+    from .modules.utils import read_id_file
+
+    identifiers = identifiers or []
     if len(identifiers) > 3:
         typer.echo(
             "You can download a maximum of 3 models at a time. Only the first 3 will be processed."
         )
         identifiers = identifiers[:3]
 
+    if file:
+        try:
+            identifiers += read_id_file(file)
+        except OSError as e:
+            feedback_message(f"Could not read {file}: {e}", "error")
+            raise typer.Exit(code=1)
+        identifiers = list(dict.fromkeys(identifiers))
+
     typer.echo(f"Preparing to download {len(identifiers)} model(s)...")
 
     return download_model_cli(
         identifiers,
         select,
+        yes,
         MODELS_DIR=MODELS_DIR,
         CIVITAI_MODELS=CIVITAI_MODELS,
         CIVITAI_DOWNLOAD=CIVITAI_DOWNLOAD,
@@ -319,6 +405,9 @@ def remove_models_command():
     Remove specified models from local storage.
     :return: The removal of the models.
     """
+    from civitai_models_manager import MODELS_DIR
+    from .modules.remove import remove_models_cli
+
     return remove_models_cli(MODELS_DIR=MODELS_DIR, TYPES=TYPES, FILE_TYPES=FILE_TYPES)
 
 
@@ -343,4 +432,6 @@ def about_command(
     """
     Show README.md and/or CHANGELOG.md content.
     """
+    from .modules.tools import about_cli
+
     about_cli(readme, changelog)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from rich.console import Console
+
+__all__ = ["console", "h2t"]
+
+# Shared by every module so the terminal is probed once per process
+console = Console(soft_wrap=True)
+
+
+def __getattr__(name: str):
+    # The HTML converter is only needed by details and explain, so it is
+    # built on first use instead of on every import of this module
+    if name == "h2t":
+        import html2text
+
+        h2t = html2text.HTML2Text()
+        h2t.body_width = 0  # Rich handles wrapping
+        h2t.ignore_images = True  # Images are listed separately in the details view
+        globals()["h2t"] = h2t
+        return h2t
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
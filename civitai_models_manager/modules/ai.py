@@ -1,23 +1,27 @@
 import os
+import re
+import asyncio
 import warnings
-import html2text
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from rich.markdown import Markdown
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Union
+from rich.live import Live
 from rich.table import Table
-from rich.console import Console
+from ._render import console
 
-from ollama import Client as OllamaClient
-from openai import OpenAI as OpenAIClient
-from groq import Groq as GroqClient
-from .details import get_model_details
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+from .details import get_model_details_async
 from .helpers import feedback_message
+from .session import new_async_session
+from .cache import summary_key, load_summary, store_summary
 
 # from transformers import pipeline
 
-console = Console(soft_wrap=True)
 
-h2t = html2text.HTML2Text()
+# Summaries are normally Markdown already; only HTML needs converting
+looks_like_html = re.compile(r"<[a-zA-Z/][^>]*>").search
 
 current_dir = Path(__file__).resolve().parent
 cache_dir = current_dir / "models" / ".cache"
@@ -54,11 +58,54 @@ warnings.filterwarnings(
 #         return None
 
 
+# The SDKs are imported on first use; each pulls in pydantic and its own
+# HTTP stack, which would otherwise load on every command.
+@lru_cache(maxsize=None)
+def get_ollama_client(api_base: str):
+    from ollama import Client as OllamaClient
+
+    return OllamaClient(api_base)
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str):
+    from openai import OpenAI as OpenAIClient
+
+    return OpenAIClient(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def get_groq_client(api_key: str):
+    from groq import Groq as GroqClient
+
+    return GroqClient(api_key=api_key)
+
+
+SERVICES = {
+    "ollama": ("OLLAMA_OPTIONS", "api_base", get_ollama_client),
+    "openai": ("OPENAI_OPTIONS", "api_key", get_openai_client),
+    "groq": ("GROQ_OPTIONS", "api_key", get_groq_client),
+}
+
+
+def get_service_client(service: str, options: Dict[str, Any]):
+    """Return the cached client for service, or None if it is not configured."""
+    _, credential, get_client = SERVICES[service]
+    return get_client(options[credential]) if options.get(credential) else None
+
+
 # TODO: Fix the markdown output
 def summarize_model_description(
-    model, model_id: int, service: str, **kwargs
-) -> Optional[str]:
-    """Summarize the model description using the specified API service."""
+    model, model_id: int, service: str, client, options: Dict[str, Any]
+) -> Iterator[str]:
+    """
+    Summarize the model description using the specified API service.
+
+    The summary is streamed, yielding each piece of text as the service
+    generates it. Finished summaries are cached by description, model,
+    prompt and sampling settings for the cache TTL, so explaining the same
+    model again costs no service call.
+    """
     model_details = model
     description = model_details.get("description", "No description available.")
 
@@ -66,124 +113,173 @@ def summarize_model_description(
     # print(explanation)
     # return
 
+    if client is None:
+        return
+
+    model_name = options["model"]
+    key = summary_key(
+        service,
+        model_name,
+        options["system_template"],
+        # Sampling settings change the output, so they are part of the key
+        str(options.get("temperature", "")),
+        str(options.get("top_p", "")),
+        description,
+    )
+    cached = load_summary(key)
+    if cached:
+        yield cached
+        return
+
+    messages = [
+        {"role": "system", "content": options["system_template"]},
+        {"role": "user", "content": description},
+    ]
+
+    summary: List[str] = []
     try:
-        if service == "ollama" and kwargs.get("Ollama"):
-            response = kwargs.get("Ollama").chat(
-                model=kwargs.get("OLLAMA_OPTIONS")["model"],
-                messages=[
-                    {
-                        "role": "assistant",
-                        "content": kwargs.get("OLLAMA_OPTIONS")["system_template"],
-                    },
-                    {
-                        "role": "user",
-                        "content": f"{kwargs.get('OLLAMA_OPTIONS')['system_template']} : {description}",
-                    },
-                    # consider adding the system template
-                    # to the prompt since not all models follow it
-                ],
+        if service == "ollama":
+            response = client.chat(
+                model=model_name,
+                messages=messages,
                 options={
-                    "temperature": float(kwargs.get("OLLAMA_OPTIONS")["temperature"]),
-                    "top_p": float(kwargs.get("OLLAMA_OPTIONS")["top_p"]),
+                    "temperature": float(options["temperature"]),
+                    "top_p": float(options["top_p"]),
                 },
                 keep_alive=0,  # Free up the VRAM
+                stream=True,
             )
-            if "message" in response and "content" in response["message"]:
-                if not kwargs.get("OLLAMA_OPTIONS")["html_output"]:
-                    return h2t.handle(response["message"]["content"])
-                else:
-                    return Markdown(response["message"]["content"], justify="left")
+            for part in response:
+                if "message" in part and "content" in part["message"]:
+                    summary.append(part["message"]["content"])
+                    yield summary[-1]
 
-        elif service == "openai" and kwargs.get("OpenAI"):
+        elif service in ("openai", "groq"):
             feedback_message(
                 "OpenAI may not display due to content censorship\nconsider using a uncensored local model",
                 "warning",
             )
 
-            response = kwargs.get("OpenAI").chat.completions.create(
-                model=kwargs.get("OPENAI_OPTIONS")["model"],
-                messages=[
-                    {
-                        "role": "assistant",
-                        "content": kwargs.get("OPENAI_OPTIONS")["system_template"],
-                    },
-                    {"role": "user", "content": description},
-                ],
+            response = client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                stream=True,
             )
-            return Markdown(response.choices[0].message.content, justify="left")
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    summary.append(chunk.choices[0].delta.content)
+                    yield summary[-1]
 
-        elif service == "groq" and kwargs.get("Groq"):
-            feedback_message(
-                "OpenAI may not display due to content censorship \n consider using a uncensored local model",
-                "warning",
-            )
-            response = kwargs.get("Groq").chat.completions.create(
-                model=kwargs.get("GROQ_OPTIONS")["model"],
-                messages=[
-                    {
-                        "role": "assistant",
-                        "content": kwargs.get("GROQ_OPTIONS")["system_template"],
-                    },
-                    {"role": "user", "content": description},
-                ],
-            )
-            return Markdown(response.choices[0].message.content, justify="left")
+        # Only a stream that ran to completion is worth keeping
+        if summary:
+            store_summary(key, "".join(summary))
 
     except Exception as e:
         feedback_message(
             f"Failed to summarize the model description using {service} // {e}", "error"
         )
-        return None
 
 
-def explain_model_cli(identifier: str, service: str = "ollama", **kwargs) -> None:
-    Ollama = (
-        OllamaClient(kwargs.get("OLLAMA_OPTIONS")["api_base"])
-        if kwargs.get("OLLAMA_OPTIONS")["api_base"]
-        else None
-    )
-    OpenAI = (
-        OpenAIClient(api_key=kwargs.get("OPENAI_OPTIONS")["api_key"])
-        if kwargs.get("OPENAI_OPTIONS")["api_key"]
-        else None
-    )
-    Groq = (
-        GroqClient(api_key=kwargs.get("GROQ_OPTIONS")["api_key"])
-        if kwargs.get("GROQ_OPTIONS")["api_key"]
-        else None
-    )
+def render_summary(title: str, content: Union[str, "Markdown"]) -> Table:
+    summary_table = Table(title_justify="left")
+    summary_table.add_column(title, style="cyan")
+    summary_table.add_row(content)
+    return summary_table
 
-    try:
-        model = get_model_details(
-            kwargs.get("CIVITAI_MODELS"), kwargs.get("CIVITAI_VERSIONS"), identifier
-        )
-        model_id = model.get("id", "")
-        model_name = model.get("name", "")
-
-        with console.status(
-            f"[yellow]Asking {service} to explain model description", spinner="dots"
-        ) as status:
-            summary = summarize_model_description(
-                model,
-                model_id,
-                service,
-                Ollama=Ollama,
-                OpenAI=OpenAI,
-                Groq=Groq,
-                OLLAMA_OPTIONS=kwargs.get("OLLAMA_OPTIONS"),
-                OPENAI_OPTIONS=kwargs.get("OPENAI_OPTIONS"),
-                GROQ_OPTIONS=kwargs.get("GROQ_OPTIONS"),
+
+def print_explanation(
+    model: Dict[str, Any], service: str, client, options: Dict[str, Any]
+) -> None:
+    # rich.markdown pulls in markdown-it and pygments; only explain needs it
+    from rich.markdown import Markdown
+
+    model_id = model.get("id", "")
+    model_name = model.get("name", "")
+
+    title = f"Explanation of model {model_name} // {model_id} using {service}:"
+    summary: List[str] = []
+
+    def current_summary() -> Table:
+        if not summary:
+            return render_summary(
+                title, f"[yellow]Asking {service} to explain model description"
             )
-            status.update(f"[green]Summary completed for {model_name}")
+        text = "".join(summary)
+        if looks_like_html(text):
+            from ._render import h2t
+
+            text = h2t.handle(text)
+        return render_summary(title, Markdown(text, justify="left"))
+
+    # Rendering is left to the Live refresh so the growing text is only
+    # re-parsed a few times a second rather than on every token.
+    with Live(console=console, refresh_per_second=10, get_renderable=current_summary):
+        for chunk in summarize_model_description(
+            model, model_id, service, client, options
+        ):
+            summary.append(chunk)
+        if not summary:
+            summary.append("No summary available.")
 
-        summary_table = Table(title_justify="left")
-        summary_table.add_column(
-            f"Explanation of model {model_name} // {model_id} using {service}:",
-            style="cyan",
-        )
-        summary_table.add_row(summary or "No summary available.")
 
-        console.print(summary_table)
+async def explain_models(
+    model_ids: List[int], service: str, options: Dict[str, Any], **kwargs
+) -> None:
+    """
+    Explain each model in turn, fetching the next model's details while the
+    current summary streams.
 
+    The service client is built in a thread alongside the first fetch, so the
+    SDK import overlaps the CivitAI round trip.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+    async def produce() -> None:
+        try:
+            async with new_async_session() as session:
+                for model_id in model_ids:
+                    model = await get_model_details_async(
+                        session,
+                        kwargs.get("CIVITAI_MODELS"),
+                        kwargs.get("CIVITAI_VERSIONS"),
+                        model_id,
+                    )
+                    await queue.put(model)
+        finally:
+            # Always end the stream, so a failed fetch cannot leave the
+            # consumer waiting; awaiting the producer re-raises the error
+            await queue.put(None)
+
+    producer = asyncio.ensure_future(produce())
+    client = await asyncio.to_thread(get_service_client, service, options)
+
+    while True:
+        model = await queue.get()
+        if model is None:
+            break
+        if not model:
+            feedback_message("No model found for the given ID.", "error")
+            continue
+        await asyncio.to_thread(print_explanation, model, service, client, options)
+
+    await producer
+
+
+def explain_model_cli(
+    identifiers: List[str], service: str = "ollama", **kwargs
+) -> None:
+    if service not in SERVICES:
+        feedback_message(
+            f"Unknown service {service}. Please choose from: {', '.join(SERVICES)}",
+            "error",
+        )
+        return
+
+    try:
+        model_ids = [int(identifier) for identifier in identifiers]
     except ValueError:
         feedback_message("Invalid model ID. Please enter a valid number.", "error")
+        return
+
+    options = kwargs.get(SERVICES[service][0])
+    asyncio.run(explain_models(model_ids, service, options, **kwargs))
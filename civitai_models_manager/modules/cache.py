@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import httpx
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .utils import json_loads
+
+__all__ = [
+    "load_cached",
+    "is_fresh",
+    "conditional_headers",
+    "store_cached",
+    "save_entry",
+    "summary_key",
+    "load_summary",
+    "store_summary",
+    "clear_cache",
+    "CACHE_DIR",
+]
+
+CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "civitai-model-manager"
+)
+SUMMARY_DIR = CACHE_DIR / "summaries"
+MAX_AGE = 3600  # seconds an entry is trusted without revalidating
+
+
+def cache_ttl() -> float:
+    """The freshness window, overridable with CIVITAI_CACHE_TTL (0 disables it)."""
+    try:
+        return float(os.getenv("CIVITAI_CACHE_TTL") or MAX_AGE)
+    except ValueError:
+        return MAX_AGE
+
+
+def cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def load_cached(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the cached response for url.
+
+    :param url: The requested URL.
+    :return: The cache entry with its validators and body, or None.
+    """
+    try:
+        return json_loads(cache_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(
+    entry: Optional[Dict[str, Any]], max_age: Optional[float] = None
+) -> bool:
+    """Whether entry was fetched recently enough to skip revalidation."""
+    if max_age is None:
+        max_age = cache_ttl()
+    return bool(entry) and time.time() - entry.get("fetched_at", 0) < max_age
+
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build the revalidation headers for a cache entry."""
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def store_cached(url: str, response: httpx.Response, body: Any) -> None:
+    """
+    Store a successful response that carries a validator.
+
+    Responses without an ETag or Last-Modified header cannot be revalidated,
+    so they are not cached.
+    """
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if response.status_code != 200 or not (etag or last_modified):
+        return
+
+    save_entry(url, {"etag": etag, "last_modified": last_modified, "body": body})
+
+
+def save_entry(url: str, entry: Dict[str, Any]) -> None:
+    """Write entry for url, starting its freshness window now."""
+    entry["fetched_at"] = time.time()
+    _write_atomic(cache_path(url), json.dumps(entry))
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """
+    Write text to path through a temp file, so readers never see a partial
+    entry. Failures are ignored since the cache is only an optimisation.
+    """
+    temp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, delete=False
+        ) as f:
+            temp_name = f.name
+            f.write(text)
+        os.replace(temp_name, path)
+    except OSError:
+        # Don't leave the temp file behind in the cache directory
+        if temp_name:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+
+
+def summary_key(*parts: str) -> str:
+    """Content address for a summary of the given description and settings."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_summary(key: str, max_age: Optional[float] = None) -> Optional[str]:
+    """
+    Load a finished summary younger than the cache TTL.
+
+    Summaries cannot be revalidated, so they simply expire; --no-cache sets
+    the TTL to 0 and always asks the service again.
+    """
+    if max_age is None:
+        max_age = cache_ttl()
+    path = SUMMARY_DIR / f"{key}.md"
+    try:
+        if time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def store_summary(key: str, summary: str) -> None:
+    _write_atomic(SUMMARY_DIR / f"{key}.md", summary)
+
+
+def clear_cache() -> int:
+    """
+    Delete every cached response and summary.
+
+    :return: The number of files removed.
+    """
+    removed = 0
+    for directory in (CACHE_DIR, SUMMARY_DIR):
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_file():
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
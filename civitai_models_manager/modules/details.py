@@ -2,26 +2,28 @@ import httpx
 import subprocess
 
 from typing import Any, Dict, List, Tuple, Optional
-import html2text
 import questionary
+import typer
 import re
 
 from .helpers import feedback_message, create_table, add_rows_to_table
-from .utils import safe_get, safe_url, format_file_size
+from .session import new_async_session
+from .cache import (
+    load_cached,
+    is_fresh,
+    conditional_headers,
+    store_cached,
+    save_entry,
+)
+from .utils import safe_get, safe_url, format_file_size, json_loads
 from enum import Enum
 from rich.text import Text
-from rich.markdown import Markdown
-from rich.console import Console
+from ._render import console
 
 
 __all__ = ["get_model_details_cli"]
 
-console = Console(soft_wrap=True)
-h2t = html2text.HTML2Text()
-
-
-def fetch_model_data(url: str, model_id: int) -> Optional[Dict]:
-    return make_request(f"{url}/{model_id}")
+MAX_CONCURRENT_REQUESTS = 16  # metadata lookups, matches the session pool
 
 
 class DetailActions(Enum):
@@ -34,44 +36,86 @@ class DetailActions(Enum):
     CANCEL = "Cancel"
 
 
-def fetch_version_data(
-    versions_url: str, models_url: str, model_id: int
-) -> Optional[Dict]:
-    version_data = make_request(f"{versions_url}/{model_id}")
-    if version_data:
-        parent_model_data = make_request(f"{models_url}/{version_data.get('modelId')}")
-        if parent_model_data:
-            return {**version_data, **parent_model_data}
-    return None
+def get_model_details(
+    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int
+) -> Dict[str, Any]:
+    """Synchronous wrapper around get_model_details_async."""
 
+    async def fetch() -> Dict[str, Any]:
+        async with new_async_session() as client:
+            return await get_model_details_async(
+                client, CIVITAI_MODELS, CIVITAI_VERSIONS, model_id
+            )
 
-def make_request(url: str) -> Optional[Dict]:
+    return asyncio.run(fetch())
+
+
+async def fetch_all_model_details(
+    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_ids: List[int]
+) -> List[Dict[str, Any]]:
+    """Fetch the details of every model concurrently over one client."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with new_async_session() as client:
+
+        async def fetch(model_id: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await get_model_details_async(
+                    client, CIVITAI_MODELS, CIVITAI_VERSIONS, model_id
+                )
+
+        return await asyncio.gather(*(fetch(model_id) for model_id in model_ids))
+
+
+async def make_request_async(client: httpx.AsyncClient, url: str) -> Optional[Dict]:
     try:
-        response = httpx.get(url)
+        cached = load_cached(url)
+        if is_fresh(cached):
+            return cached["body"]
+        response = await client.get(url, headers=conditional_headers(cached))
+        if response.status_code == 304 and cached:
+            save_entry(url, cached)  # confirmed unchanged, trust it again
+            return cached["body"]
         if response.status_code == 404:
-            # TODO: Write a check for model versions that return 404 since civitai on gives pages to parent models and not versions
-            pass
-        else:
-            response.raise_for_status()
-        return response.json()
-
-    except httpx.RequestError as e:
+            # A 404 on the models endpoint means the ID may be a version;
+            # the caller checks the error body, if there is one
+            try:
+                return json_loads(response.content)
+            except ValueError:
+                return {"error": "Not found"}
+        response.raise_for_status()
+        data = json_loads(response.content)
+        store_cached(url, response, data)
+        return data
+
+    except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as e:
+        # One failed lookup should not abort the other models being fetched
         feedback_message(f"Failed to get data from {url}: {e}", "error")
         return None
 
 
-def get_model_details(
-    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int
+async def get_model_details_async(
+    client: httpx.AsyncClient, CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int
 ) -> Dict[str, Any]:
+    """Async variant of get_model_details sharing the caller's client."""
     if not model_id:
         feedback_message("Please provide a valid model ID.", "error")
         return {}
 
-    model_data = fetch_model_data(CIVITAI_MODELS, model_id)
+    model_data = await make_request_async(client, f"{CIVITAI_MODELS}/{model_id}")
+
+    if model_data and "error" in model_data:
+        model_data = None
+        version_data = await make_request_async(
+            client, f"{CIVITAI_VERSIONS}/{model_id}"
+        )
+        if version_data and "error" not in version_data:
+            parent_model_data = await make_request_async(
+                client, f"{CIVITAI_MODELS}/{version_data.get('modelId')}"
+            )
+            if parent_model_data:
+                model_data = {**version_data, **parent_model_data}
 
-    if "error" in model_data:
-        model_data = fetch_version_data(CIVITAI_VERSIONS, CIVITAI_MODELS, model_id)
-    
     return process_model_data(model_data) if model_data else {}
 
 
@@ -99,22 +143,31 @@ def process_string(v: Dict[str, Any], data: Dict[str, Any], idx: int) -> str:
     return processed
 
 
+def process_version(v: Dict[str, Any], data: Dict[str, Any], idx: int) -> Dict[str, Any]:
+    # Versions without files or images come back with empty lists
+    file = safe_get(v, ["files", 0]) or {}
+    image = safe_get(v, ["images", 0]) or {}
+    return {
+        "id": v.get("id", ""),
+        "name": v.get("name", ""),
+        "base_model": v.get("baseModel", ""),
+        "download_url": file.get("downloadUrl", ""),
+        "images": image.get("url", ""),
+        "file": file.get("name", ""),
+        "size_kb": file.get("sizeKB", 0),
+        "air": process_string(v, data, idx)
+        #f"urn:air:{v.get('baseModel', '')}:{data.get('type', 'checkpoint')}:civitai:{data.get('id')}@{v.get('id')}".lower().replace("flux.1 s", "flux1")
+    }
+
+
 def process_model_data(data: Dict) -> Dict[str, Any]:
     is_version = "model" in data
-    
+    # A version response carries the fields a model keeps on its latest version
+    latest = data if is_version else safe_get(data, ["modelVersions", 0]) or {}
 
     versions = (
         [
-            {
-                "id": v.get("id", ""),
-                "name": v.get("name", ""),
-                "base_model": v.get("baseModel", ""),
-                "download_url": v.get("files", [{}])[0].get("downloadUrl", ""),
-                "images": v.get("images", [{}])[0].get("url", ""),
-                "file": v.get("files", [{}])[0].get("name", ""),
-                "air": process_string(v, data, i) 
-                #f"urn:air:{v.get('baseModel', '')}:{data.get('type', 'checkpoint')}:civitai:{data.get('id')}@{v.get('id')}".lower().replace("flux.1 s", "flux1")
-            }
+            process_version(v, data, i)
             for i, v in enumerate(data.get("modelVersions", []))
         ]
         if not is_version
@@ -130,22 +183,10 @@ def process_model_data(data: Dict) -> Dict[str, Any]:
         "type": safe_get(data, ["model", "type"] if is_version else ["type"], ""),
         "base_model": data.get("baseModel", ""),
         "air": data.get("air", ""),
-        "download_url": safe_get(
-            data,
-            ["modelVersions", 0, "downloadUrl"] if not is_version else ["downloadUrl"],
-            "",
-        ),
+        "download_url": latest.get("downloadUrl", ""),
         "tags": data.get("tags", []),
         "creator": safe_get(data, ["creator", "username"], ""),
-        "trainedWords": safe_get(
-            data,
-            (
-                ["modelVersions", 0, "trainedWords"]
-                if not is_version
-                else ["trainedWords"]
-            ),
-            "None",
-        ),
+        "trainedWords": latest.get("trainedWords", "None"),
         "nsfw": (
             Text("Yes", style="bright_yellow")
             if data.get("nsfw", False)
@@ -153,22 +194,25 @@ def process_model_data(data: Dict) -> Dict[str, Any]:
         ),
         "metadata": get_metadata(data, is_version),
         "versions": versions,
-        "images": safe_get(
-            data, ["modelVersions", 0, "images"] if not is_version else ["images"], []
-        ),
+        "images": latest.get("images", []),
     }
 
 
 def get_metadata(data: Dict, is_version: bool) -> Dict[str, Any]:
-    stats_path = ["stats"] if not is_version else ["model", "stats"]
-    files_path = ["modelVersions", 0, "files", 0] if not is_version else ["files", 0]
+    stats = safe_get(data, ["model", "stats"] if is_version else ["stats"]) or {}
+    file = (
+        safe_get(data, ["files", 0] if is_version else ["modelVersions", 0, "files", 0])
+        or {}
+    )
+    size_kb = file.get("sizeKB", 0)
     return {
-        "stats": f"{safe_get(data, stats_path + ['downloadCount'], '')} downloads, "
-        f"{safe_get(data, stats_path + ['thumbsUpCount'], '')} likes, "
-        f"{safe_get(data, stats_path + ['thumbsDownCount'], '')} dislikes",
-        "size": format_file_size(safe_get(data, files_path + ["sizeKB"], 0)),
-        "format": safe_get(data, files_path + ["metadata", "format"], ".safetensors"),
-        "file": safe_get(data, files_path + ["name"], ""),
+        "stats": f"{stats.get('downloadCount', '')} downloads, "
+        f"{stats.get('thumbsUpCount', '')} likes, "
+        f"{stats.get('thumbsDownCount', '')} dislikes",
+        "size": format_file_size(size_kb * 1024),
+        "format": safe_get(file, ["metadata", "format"], ".safetensors"),
+        "file": file.get("name", ""),
+        "size_kb": size_kb,
     }
 
 
@@ -194,6 +238,10 @@ def print_model_details(
     console.print(model_table)
 
     if desc:
+        # Only the description view needs html2text and rich.markdown
+        from rich.markdown import Markdown
+        from ._render import h2t
+
         desc_table = create_table("", [("Description", "white")])
         desc_table.add_row(Markdown(h2t.handle( model_details["description"])))
         console.print(desc_table)
@@ -308,16 +356,38 @@ def get_model_details_cli(
     CIVITAI_MODELS: str = "",
     CIVITAI_VERSIONS: str = "",
 ) -> None:
-    """Get detailed information about a specific model by ID."""
+    """
+    Get detailed information about a specific model by ID.
+
+    Several comma separated IDs are fetched concurrently, then shown in turn.
+    """
     try:
-        model_id = int(identifier)
-        model_details = get_model_details(CIVITAI_MODELS, CIVITAI_VERSIONS, model_id)
+        model_ids = [int(part) for part in identifier.split(",") if part.strip()]
+        if not model_ids:
+            raise ValueError(identifier)
+    except ValueError:
+        feedback_message("Invalid model ID. Please enter a valid number.", "error")
+        return
+
+    if len(model_ids) > 1:
+        with console.status("[yellow]Fetching model details...", spinner="dots"):
+            all_details = asyncio.run(
+                fetch_all_model_details(CIVITAI_MODELS, CIVITAI_VERSIONS, model_ids)
+            )
+    else:
+        all_details = [
+            get_model_details(CIVITAI_MODELS, CIVITAI_VERSIONS, model_id)
+            for model_id in model_ids
+        ]
 
+    found = False
+    for model_id, model_details in zip(model_ids, all_details):
         if model_details:
+            found = True
             print_model_details(model_details, desc, images)
             # model_id = typer.prompt("Enter the model ID to download model or \"search\" for a quick search by tags; \"cancel\" to cancel", default="")
         else:
-            feedback_message(f"No model found with ID: {identifier}", "error")
+            feedback_message(f"No model found with ID: {model_id}", "error")
 
-    except ValueError:
-        feedback_message("Invalid model ID. Please enter a valid number.", "error")
+    if not found:
+        raise typer.Exit(code=1)
@@ -1,22 +1,58 @@
 import os
+import asyncio
 import httpx
-import shutil
-import tempfile
+import json
 import typer
-import time
 from typing import Any, List, Dict, Optional, Tuple
-from tqdm import tqdm
-from rich.console import Console
+from ._render import console
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TransferSpeedColumn,
+)
 from .helpers import feedback_message, get_model_folder, create_table
-from .details import get_model_details
+from .details import fetch_all_model_details
+from .session import new_async_session
 
 __all__ = ["download_model_cli"]
 
-console = Console()
 
 MAX_RETRIES = 3
 TIMEOUT = 30  # seconds
+READ_TIMEOUT = 60  # seconds without a byte before a stalled stream is retried
 MAX_CONCURRENT_DOWNLOADS = 10
+MAX_CONNECTIONS = 8  # ranged connections per file
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+MIN_CHUNK_SIZE = 1 << 16  # 64 KiB
+
+
+def get_chunk_size() -> int:
+    """
+    Bytes read per iteration, overridable with DOWNLOAD_CHUNK_SIZE in the .env.
+
+    A value that is not a positive number falls back to 1 MiB with a warning,
+    and small values are raised to MIN_CHUNK_SIZE.
+    """
+    value = os.getenv("DOWNLOAD_CHUNK_SIZE", "")
+    if not value:
+        return DEFAULT_CHUNK_SIZE
+    try:
+        chunk_size = int(value)
+    except ValueError:
+        chunk_size = 0
+    if chunk_size <= 0:
+        feedback_message(
+            f"Ignoring DOWNLOAD_CHUNK_SIZE={value!r}; downloading in 1 MiB chunks.",
+            "warning",
+        )
+        return DEFAULT_CHUNK_SIZE
+    return max(chunk_size, MIN_CHUNK_SIZE)
+
+
+CHUNK_SIZE = get_chunk_size()
 
 
 def select_version(
@@ -35,7 +71,9 @@ def select_version(
         ],
     )
 
+    versions_by_id = {}
     for version in versions:
+        versions_by_id[str(version["id"])] = version
         versions_table.add_row(
             str(version["id"]), version["name"], version["base_model"]
         )
@@ -43,9 +81,9 @@ def select_version(
     console.print(versions_table)
     selected_version_id = typer.prompt("Enter the version ID to download:")
 
-    for version in versions:
-        if str(version["id"]) == selected_version_id:
-            return version
+    selected_version = versions_by_id.get(selected_version_id.strip())
+    if selected_version:
+        return selected_version
 
     feedback_message(
         f"Version {selected_version_id} is not available for model {model_name}.",
@@ -55,20 +93,37 @@ def select_version(
 
 
 def check_for_upgrade(
-    versions: dict, model_path: str, selected_version: Dict[str, Any]
+    versions: dict,
+    model_path: str,
+    selected_version: Dict[str, Any],
+    yes: bool = False,
 ) -> bool:
     current_version = os.path.basename(model_path)
+    if current_version == selected_version["file"]:
+        # The selected version is the file already on disk
+        return False
     latest_version = versions[0].get("file")
-    print(latest_version, selected_version["file"])
     if latest_version != selected_version["file"] and latest_version != current_version:
         feedback_message(
             f"A newer version '{selected_version['file']}' is available.", "info"
         )
-        return typer.confirm("Do you want to upgrade?", default=True)
+        return yes or typer.confirm("Do you want to upgrade?", default=True)
     return False
 
 
-def download_model(
+def is_complete(model_path: str, expected_size: int) -> bool:
+    """
+    Check a model on disk against the size reported by the API.
+
+    sizeKB is a float, so sizes within a kilobyte are treated as equal. An
+    unknown expected size counts as complete.
+    """
+    if not expected_size:
+        return True
+    return abs(os.stat(model_path).st_size - expected_size) < 1024
+
+
+def prepare_download(
     MODELS_DIR: str,
     CIVITAI_DOWNLOAD: str,
     CIVITAI_TOKEN: str,
@@ -76,7 +131,14 @@ def download_model(
     model_id: int,
     model_details: Dict[str, Any],
     select: bool = False,
-) -> Optional[str]:
+    yes: bool = False,
+) -> Optional[Tuple[str, str, str]]:
+    """
+    Resolve the version, target path and URL for a model, prompting if needed.
+
+    :param yes: Upgrade existing models without asking.
+    :return: The download URL, target path and model name, or None to skip.
+    """
     model_name = model_details.get("name", f"Model_{model_id}")
     model_type = model_details.get("type", "unknown")
     model_meta = model_details.get("metadata", {})
@@ -96,6 +158,7 @@ def download_model(
             "download_url": model_details.get("download_url", ""),
             "images": model_details["images"][0].get("url", ""),
             "file": model_meta.get("file", ""),
+            "size_kb": model_meta.get("size_kb", 0),
         }
     else:
         if model_details.get("parent_id"):
@@ -117,8 +180,14 @@ def download_model(
         selected_version.get("file"),
     )
 
-    if os.path.exists(model_path):
-        if not check_for_upgrade(versions, model_path, selected_version):
+    expected_size = round(float(selected_version.get("size_kb") or 0) * 1024)
+    if os.path.exists(model_path) and not is_complete(model_path, expected_size):
+        feedback_message(
+            f"Model {model_name} at {model_path} is incomplete. Downloading again.",
+            "warning",
+        )
+    elif os.path.exists(model_path):
+        if not check_for_upgrade(versions, model_path, selected_version, yes):
             feedback_message(
                 f"Model {model_name} already exists at {model_path}. Skipping download.",
                 "warning",
@@ -126,117 +195,404 @@ def download_model(
             return None
 
     os.makedirs(os.path.dirname(model_path), exist_ok=True)
-    return download_file(
+    return (
         f"{CIVITAI_DOWNLOAD}/{selected_version['id']}?token={CIVITAI_TOKEN}",
         model_path,
         model_name,
     )
 
 
-def download_file(url: str, path: str, desc: str) -> Optional[str]:
-    temp_file = None
+def get_validator(headers: httpx.Headers) -> str:
+    """
+    Pick the header that identifies this version of the file for If-Range.
+
+    Weak ETags are not allowed in If-Range, so Last-Modified is used instead.
+    """
+    etag = headers.get("etag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("last-modified", "")
+
+
+async def probe_download(
+    client: httpx.AsyncClient, url: str
+) -> Tuple[str, int, bool, str]:
+    """
+    Resolve the final download URL and discover its size and range support.
+
+    CivitAI redirects to a signed CDN URL; the resolved URL is returned so the
+    ranged requests skip the redirect hop. Some CDNs block HEAD requests, in
+    which case a one byte ranged GET is used to read the Content-Range header.
+
+    :param client: The HTTP client to use.
+    :param url: The download URL.
+    :return: The resolved URL, total size in bytes, whether ranges are accepted
+             and the file's validator.
+    """
     try:
-        with httpx.Client(timeout=httpx.Timeout(10.0, read=None)) as client:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    with client.stream(
-                        "GET", url, follow_redirects=True, timeout=TIMEOUT
-                    ) as response:
-                        response.raise_for_status()
-                        total_size = int(response.headers.get("content-length", 0))
-                        temp_file = tempfile.NamedTemporaryFile(
-                            delete=False, dir=os.path.dirname(path)
-                        )
-                        with tqdm(
-                            total=total_size,
-                            unit="B",
-                            unit_scale=True,
-                            desc=f"Downloading {desc}",
-                            colour="yellow",
-                        ) as progress_bar:
-                            buffer = bytearray()
-                            for chunk in response.iter_bytes(chunk_size=131072):
-                                if chunk:
-                                    buffer.extend(chunk)
-                                    progress_bar.update(len(chunk))
-                                if len(buffer) >= 1048576:  # 1MB
-                                    temp_file.write(buffer)
-                                    buffer.clear()
-                            temp_file.write(buffer)
-                        temp_file.close()
-                        shutil.move(temp_file.name, path)
-                        return path
-                except (httpx.RequestError, httpx.TimeoutException) as e:
-                    if attempt < MAX_RETRIES - 1:
-                        wait_time = 2**attempt
-                        feedback_message(
-                            f"Download failed. Retrying in {wait_time} seconds...",
-                            "warning",
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        raise
-    except Exception as e:
-        feedback_message(f"Failed to download the file: {e}", "error")
-    finally:
-        if temp_file and os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
-    return None
+        response = await client.head(url, follow_redirects=True, timeout=TIMEOUT)
+        response.raise_for_status()
+        total_size = int(response.headers.get("content-length", 0))
+        accepts_ranges = response.headers.get("accept-ranges", "") == "bytes"
+        if total_size:
+            return (
+                str(response.url),
+                total_size,
+                accepts_ranges,
+                get_validator(response.headers),
+            )
+    except httpx.HTTPStatusError:
+        pass
 
+    async with client.stream(
+        "GET", url, headers={"Range": "bytes=0-0"}, follow_redirects=True
+    ) as response:
+        response.raise_for_status()
+        content_range = response.headers.get("content-range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total_size = content_range.rsplit("/", 1)[1]
+            if total_size.isdigit():
+                return (
+                    str(response.url),
+                    int(total_size),
+                    True,
+                    get_validator(response.headers),
+                )
+        return (
+            str(response.url),
+            int(response.headers.get("content-length", 0)),
+            False,
+            get_validator(response.headers),
+        )
 
-def download_multiple_models(
-    identifiers: List[str], select: bool, **kwargs
-) -> List[Tuple[str, Optional[str]]]:
-    results = []
-    for identifier in identifiers[:MAX_CONCURRENT_DOWNLOADS]:
-        result = download_single_model(identifier, select, **kwargs)
-        results.append(result)
-    return results
 
+def preallocate_file(path: str, total_size: int) -> None:
+    """
+    Reserve the full size of the download up front.
 
-def download_single_model(
-    identifier: str, select: bool, **kwargs
-) -> Tuple[str, Optional[str]]:
+    posix_fallocate allocates the extents in one go where supported; other
+    platforms and filesystems fall back to a sparse truncate.
+    """
+    with open(path, "wb") as target_file:
+        if total_size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(target_file.fileno(), 0, total_size)
+                return
+            except OSError:
+                pass
+        target_file.truncate(total_size)
+
+
+def load_resume_state(
+    path: str, total_size: int, validator: str
+) -> Optional[List[List[int]]]:
+    """
+    Load the segment progress saved by an interrupted download of path.
+
+    The state is discarded when the remote file has changed since.
+
+    :return: The [start, end, written] segments, or None to start over.
+    """
     try:
-        model_id = int(identifier)
-        model_details = get_model_details(
-            kwargs.get("CIVITAI_MODELS"),
-            kwargs.get("CIVITAI_VERSIONS"),
-            model_id,
+        with open(f"{path}.json", "r", encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        if (
+            state["total"] == total_size
+            and state.get("validator", "") == validator
+            and os.path.getsize(path) == total_size
+        ):
+            return state["segments"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def save_resume_state(
+    path: str, total_size: int, validator: str, segments: List[List[int]]
+) -> None:
+    try:
+        with open(f"{path}.json", "w", encoding="utf-8") as state_file:
+            json.dump(
+                {"total": total_size, "validator": validator, "segments": segments},
+                state_file,
+            )
+    except OSError:
+        pass
+
+
+def plan_segments(total_size: int, connections: int) -> List[List[int]]:
+    """Split total_size into up to connections [start, end, written] ranges."""
+    if total_size < connections * CHUNK_SIZE:
+        return [[0, total_size - 1, 0]]
+    segment_size = -(-total_size // connections)
+    return [
+        [start, min(start + segment_size, total_size) - 1, 0]
+        for start in range(0, total_size, segment_size)
+    ]
+
+
+async def download_segment(
+    client: httpx.AsyncClient,
+    url: str,
+    path: str,
+    segment: List[Optional[int]],
+    progress: Progress,
+    task: TaskID,
+    validator: str = "",
+) -> None:
+    """
+    Download a byte range of the file and write it at its offset in path.
+
+    :param segment: The [start, end, written] range, updated as bytes are
+                    written; an end of None streams the whole file.
+    :param validator: ETag or Last-Modified sent as If-Range, so a file that
+                      changed upstream is not stitched onto stale bytes.
+    """
+    start, end, written = segment
+    if end is not None and start + written > end:
+        return
+    headers = {}
+    if end is not None:
+        headers["Range"] = f"bytes={start + written}-{end}"
+        if validator:
+            headers["If-Range"] = validator
+    async with client.stream(
+        "GET", url, headers=headers, follow_redirects=True
+    ) as response:
+        response.raise_for_status()
+        if end is not None and response.status_code != 206:
+            raise httpx.RequestError(
+                "Server ignored the range request; the file changed upstream",
+                request=response.request,
+            )
+        with open(path, "r+b") as segment_file:
+            segment_file.seek(start + written)
+            async for chunk in response.aiter_raw(chunk_size=CHUNK_SIZE):
+                # Writes to slow disks or network shares would otherwise
+                # stall every other segment sharing the event loop
+                await asyncio.to_thread(segment_file.write, chunk)
+                segment[2] += len(chunk)
+                progress.update(task, advance=len(chunk))
+
+
+async def _download_file_async(
+    url: str,
+    path: str,
+    progress: Progress,
+    task: TaskID,
+    connections: int = MAX_CONNECTIONS,
+) -> None:
+    """
+    Download url into path using several ranged connections at once.
+
+    Falls back to a single stream when the server does not report a size or
+    does not accept range requests. When ranges are accepted, an interrupted
+    download saves its segment progress next to path and the next attempt
+    only fetches the missing bytes.
+    """
+    limits = httpx.Limits(
+        max_connections=connections, max_keepalive_connections=connections
+    )
+    # Identity encoding keeps byte ranges meaningful and lets segments be
+    # written straight from the raw stream without a decoder pass. HTTP/2
+    # stays off: it would multiplex the segments onto a single connection.
+    async with new_async_session(
+        http2=False,
+        timeout=httpx.Timeout(TIMEOUT, connect=5.0, read=READ_TIMEOUT),
+        limits=limits,
+        headers={"Accept-Encoding": "identity"},
+    ) as client:
+        resolved_url, total_size, accepts_ranges, validator = await probe_download(
+            client, url
+        )
+        resumable = accepts_ranges and total_size > 0
+
+        segments = (
+            load_resume_state(path, total_size, validator) if resumable else None
+        )
+        if segments is None:
+            preallocate_file(path, total_size)
+            segments = (
+                plan_segments(total_size, connections)
+                if resumable
+                else [[0, None, 0]]
+            )
+
+        progress.update(
+            task,
+            total=total_size or None,
+            completed=sum(written for _, _, written in segments),
         )
-        types = kwargs.get("TYPES")
-        if model_details:
-            model_path = download_model(
-                kwargs.get("MODELS_DIR"),
-                kwargs.get("CIVITAI_DOWNLOAD"),
-                kwargs.get("CIVITAI_TOKEN"),
-                types,
-                model_id,
-                model_details,
-                select,
+        downloads = [
+            asyncio.ensure_future(
+                download_segment(
+                    client, resolved_url, path, segment, progress, task, validator
+                )
             )
-            if model_path:
-                feedback_message(
-                    f"Model {identifier} downloaded successfully at: {model_path}",
-                    "info",
+            for segment in segments
+        ]
+        try:
+            await asyncio.gather(*downloads)
+            # The file is preallocated, so its size on disk proves nothing;
+            # count the bytes actually written before it is moved into place
+            received = sum(written for _, _, written in segments)
+            if total_size and received != total_size:
+                raise httpx.RequestError(
+                    f"Received {received} of {total_size} bytes",
+                    request=httpx.Request("GET", resolved_url),
                 )
-                return identifier, model_path
-            else:
-                if model_path is not None:
+        except BaseException:
+            # Stop the other segments before recording how far each got
+            for download in downloads:
+                download.cancel()
+            await asyncio.gather(*downloads, return_exceptions=True)
+            if resumable:
+                save_resume_state(path, total_size, validator, segments)
+            raise
+
+    if os.path.exists(f"{path}.json"):
+        os.unlink(f"{path}.json")
+
+
+def create_progress() -> Progress:
+    return Progress(
+        TextColumn("Downloading {task.description}"),
+        BarColumn(complete_style="yellow"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=console,
+        # Updates arrive once per chunk; a slower redraw keeps the bar cheap
+        refresh_per_second=4,
+    )
+
+
+async def download_file_async(
+    url: str, path: str, desc: str, progress: Optional[Progress] = None
+) -> Optional[str]:
+    """
+    Download url to path through a .part file, retrying on network errors.
+
+    The .part file only replaces path once every byte the server announced
+    has been written.
+
+    A failed download leaves the .part file behind so the next run can
+    resume it.
+
+    :param progress: A progress display shared with other downloads; a new
+                     one is shown when not given.
+    """
+    if progress is None:
+        with create_progress() as progress:
+            return await download_file_async(url, path, desc, progress)
+
+    task = progress.add_task(desc, total=None)
+    part_path = f"{path}.part"
+    try:
+        for attempt in range(MAX_RETRIES):
+            try:
+                await _download_file_async(url, part_path, progress, task)
+                os.replace(part_path, path)
+                return path
+            except (httpx.RequestError, httpx.TimeoutException) as e:
+                if attempt < MAX_RETRIES - 1:
+                    wait_time = 2**attempt
                     feedback_message(
-                        f"Failed to download the model {identifier}.", "error"
+                        f"Download failed. Retrying in {wait_time} seconds...",
+                        "warning",
                     )
-        else:
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise
+    except Exception as e:
+        feedback_message(f"Failed to download the file: {e}", "error")
+    return None
+
+
+async def download_all_files(
+    downloads: List[Tuple[str, str, str]]
+) -> List[Optional[str]]:
+    """Download every prepared file concurrently, one progress bar each."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    with create_progress() as progress:
+
+        async def download(url: str, path: str, desc: str):
+            async with semaphore:
+                return await download_file_async(url, path, desc, progress)
+
+        return await asyncio.gather(*(download(*item) for item in downloads))
+
+
+def display_download_summary(results: List[Tuple[str, Optional[str]]]) -> None:
+    summary_table = create_table(
+        "Download Summary",
+        [("Model ID", "bright_yellow"), ("Status", "white"), ("Path", "white")],
+    )
+    for identifier, model_path in results:
+        status = "[green]Downloaded[/green]" if model_path else "[red]Skipped[/red]"
+        summary_table.add_row(identifier, status, model_path or "")
+    console.print(summary_table)
+
+
+def download_multiple_models(
+    identifiers: List[str], select: bool, yes: bool = False, **kwargs
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Download several models at once.
+
+    Details are fetched concurrently, version selection and upgrade prompts
+    run one model at a time, then the files download concurrently.
+    """
+    model_ids: Dict[str, int] = {}
+    for identifier in identifiers:
+        try:
+            model_ids[identifier] = int(identifier)
+        except ValueError:
+            feedback_message(
+                f"Invalid model ID: {identifier}. Please enter a valid number.",
+                "error",
+            )
+
+    with console.status("[yellow]Fetching model details...", spinner="dots"):
+        all_details = asyncio.run(
+            fetch_all_model_details(
+                kwargs.get("CIVITAI_MODELS"),
+                kwargs.get("CIVITAI_VERSIONS"),
+                list(model_ids.values()),
+            )
+        )
+
+    downloads: Dict[str, Tuple[str, str, str]] = {}
+    for (identifier, model_id), model_details in zip(model_ids.items(), all_details):
+        if not model_details:
             feedback_message(f"No model found with ID: {identifier}.", "error")
-    except ValueError:
-        feedback_message(
-            f"Invalid model ID: {identifier}. Please enter a valid number.", "error"
+            continue
+        download = prepare_download(
+            kwargs.get("MODELS_DIR"),
+            kwargs.get("CIVITAI_DOWNLOAD"),
+            kwargs.get("CIVITAI_TOKEN"),
+            kwargs.get("TYPES"),
+            model_id,
+            model_details,
+            select,
+            yes,
         )
-    return identifier, None
+        if download:
+            downloads[identifier] = download
+
+    model_paths = asyncio.run(download_all_files(list(downloads.values())))
+
+    results = dict.fromkeys(model_ids)
+    results.update(zip(downloads, model_paths))
+    sorted_results = sorted(results.items(), key=lambda item: int(item[0]))
+    display_download_summary(sorted_results)
+    return sorted_results
 
 
-def download_model_cli(identifiers: List[str], select: bool = False, **kwargs) -> None:
+def download_model_cli(
+    identifiers: List[str], select: bool = False, yes: bool = False, **kwargs
+) -> None:
     if not identifiers:
         feedback_message("No model identifiers provided.", "error")
         return
-    download_multiple_models(identifiers, select, **kwargs)
+    download_multiple_models(identifiers, select, yes, **kwargs)
@@ -2,15 +2,11 @@ import os
 import typer
 
 from typing import Any, Dict
-from rich.console import Console
+from ._render import console
 from rich.table import Table
-from rich.markdown import Markdown
 from pathlib import Path
 
 
-console = Console()
-
-
 def feedback_message(message: str, type: str = "info") -> None:
     """
     Display a feedback message with appropriate styling based on the message type.
@@ -44,19 +40,24 @@ def feedback_message(message: str, type: str = "info") -> None:
     return None
 
 
+# Folders picked for unmapped model types, so a batch only asks once per type
+_chosen_folders: Dict[str, str] = {}
+
+
 def get_model_folder(models_dir: str, model_type: str, ref_types: dict) -> str:
     """
     Get the folder path for the model based on the model type.
     """
-    if model_type not in ref_types:
+    folder = ref_types.get(model_type) or _chosen_folders.get(model_type)
+    if folder is None:
         console.print(
             f"Model type '{model_type}' is not mapped to any folder. Please select a folder to download the model."
         )
-        selected_folder = typer.prompt(
+        folder = typer.prompt(
             "Enter the folder name to download the model:", default="unknown"
         )
-        return os.path.join(models_dir, selected_folder)
-    return os.path.join(models_dir, ref_types[model_type])
+        _chosen_folders[model_type] = folder
+    return os.path.join(models_dir, folder)
 
 
 def create_table(title: str, columns: list) -> Table:
@@ -81,6 +82,10 @@ def display_readme(requested_file: str) -> None:
         with readme_path.open("r", encoding="utf-8") as f:
             markdown_content = f.read()
 
+        # rich.markdown pulls in markdown-it and pygments, so only load it
+        # for the docs commands rather than with every module using helpers
+        from rich.markdown import Markdown
+
         md = Markdown(markdown_content)
         console.print(md)
     else:
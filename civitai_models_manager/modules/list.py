@@ -2,11 +2,11 @@ import os
 import questionary
 from questionary import Style
 
-from typing import List, Tuple, Dict, Optional
-from rich.console import Console
+from typing import Iterable, List, Tuple, Optional
+from ._render import console
 from .helpers import feedback_message, get_model_folder, create_table, add_rows_to_table
-from .utils import format_file_size, sort_models
-from civitai_models_manager import MODELS_DIR, FILE_TYPES, TYPES
+from .utils import format_file_size, sort_models, walk_model_files
+from civitai_models_manager import MODELS_DIR, FILE_TYPES, TYPES, TYPE_KEYS
 
 __all__ = [
     "list_models_cli",
@@ -16,7 +16,6 @@ __all__ = [
     "select_model_type",
 ]
 
-console = Console(soft_wrap=True)
 
 custom_style = Style(
     [
@@ -39,15 +38,15 @@ custom_style = Style(
 
 def list_models(model_dir: str, file_types: List[str]) -> List[Tuple[str, str, str]]:
     """List models in a given directory."""
-    models = []
-    for root, _, files in os.walk(model_dir):
-        for file in files:
-            if file.endswith(tuple(file_types)):
-                model_path = os.path.join(root, file)
-                model_name = os.path.splitext(file)[0]
-                model_type = os.path.basename(root)
-                model_size = format_file_size(os.path.getsize(model_path))
-                models.append((model_name, model_type, model_path, model_size))
+    models = [
+        (
+            os.path.splitext(entry.name)[0],
+            os.path.basename(directory),
+            entry.path,
+            format_file_size(entry.stat().st_size),
+        )
+        for directory, entry in walk_model_files(model_dir, tuple(file_types))
+    ]
     return sort_models(models)
 
 
@@ -69,9 +68,9 @@ def display_models_table(models: List[Tuple[str, str, str]], model_type: str) ->
     console.print(list_table)
 
 
-def select_model_type(types: Dict[str, str]) -> Optional[str]:
+def select_model_type(types: Iterable[str]) -> Optional[str]:
     """Prompt user to select a model type."""
-    choices = list(types.keys()) + ["Exit"]
+    choices = [*types, "Exit"]
     selected = questionary.select(
         "Select the type of model you would like to list (or 'Exit' to quit):",
         choices=choices,
@@ -106,7 +105,7 @@ def local_search_cli(query: str, MODELS_DIR: str, FILE_TYPES: List[str]) -> None
 def list_models_cli() -> None:
     """List available models along with their types and paths."""
     while True:
-        model_type = select_model_type(TYPES)
+        model_type = select_model_type(TYPE_KEYS)
         if model_type is None:
             return
 
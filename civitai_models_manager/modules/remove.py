@@ -1,16 +1,19 @@
 import os
 import typer
 import questionary
-from questionary import Style
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
-from rich.console import Console
+from ._render import console
 from .helpers import feedback_message, get_model_folder, create_table
 from .utils import format_file_size, safe_get
-from .list import list_models
+from .list import list_models, custom_style
+from civitai_models_manager import TYPE_KEYS
 
-
-console = Console(soft_wrap=True)
+MAX_REMOVE_WORKERS = 8
+MODEL_TYPES_MENU = "\n".join(
+    f"{index}. {model_type}" for index, model_type in enumerate(TYPE_KEYS, start=1)
+)
 
 
 def group_models_alphabetically(models: List[Tuple[str, str, str, str]]) -> dict:
@@ -26,24 +29,6 @@ def group_models_alphabetically(models: List[Tuple[str, str, str, str]]) -> dict
 def select_models_to_delete(
     models_in_folder: List[Tuple[str, str, str, str]]
 ) -> List[Tuple[str, str, str, str]]:
-    custom_style = Style(
-        [
-            ("qmark", "fg:#ffff00 bold"),  # Yellow question mark
-            ("question", "fg:#ffffff bold"),  # White bold question text
-            ("answer", "fg:#ffff00 bold"),  # Yellow bold answer text
-            ("pointer", "fg:#ffff00 bold"),  # Yellow bold pointer
-            (
-                "highlighted",
-                "fg:#000000 bg:#00FFFF bold",
-            ),  # black text on cyan background for highlighted items
-            ("selected", "fg:#ffff00"),  # Yellow for selected items
-            ("separator", "fg:#ffff00"),  # Yellow separator
-            ("instruction", "fg:#ffffff"),  # White instruction text
-            ("text", "fg:#ffffff"),  # White general text
-            ("disabled", "fg:#ffff00 italic"),  # Yellow italic for disabled items
-        ]
-    )
-
     # Ask if the user needs to delete more than one model
     multiple_delete = questionary.confirm(
         "Do you need to delete more than one model?", style=custom_style
@@ -85,46 +70,55 @@ def select_models_to_delete(
         return [matching_model] if matching_model else []
 
 
-def remove_model(model_path: str) -> bool:
-    if os.path.exists(model_path):
-        if not os.access(model_path, os.W_OK):
-            feedback_message(
-                f"You do not have permission to remove the model at {model_path}.",
-                "warning",
-            )
-            return False
-
-        total_size = os.path.getsize(model_path)
-        try:
-            os.remove(model_path)
-            feedback_message(
-                f"Model at {model_path} removed successfully. Freed up {format_file_size(total_size)}",
-                "info",
-            )
-            return True
-        except OSError as e:
-            feedback_message(
-                f"Failed to remove the model at {model_path} // {e}.", "error"
-            )
-            return False
-    else:
-        feedback_message(f"No model found at {model_path}.", "warning")
-    return False
+def delete_model_file(
+    model_path: str, model_size: Optional[str] = None
+) -> Tuple[bool, str, str]:
+    """
+    Delete a model file without printing, so it can run in a worker thread.
 
+    :param model_path: The path of the model to delete.
+    :param model_size: The formatted size from list_models; the file is only
+                       stat'ed when it is not already known.
+    :return: Whether it was removed, and the message and message type to report.
+    """
+    try:
+        if model_size is None:
+            model_size = format_file_size(os.path.getsize(model_path))
+        os.remove(model_path)
+    except FileNotFoundError:
+        return False, f"No model found at {model_path}.", "warning"
+    except PermissionError:
+        return (
+            False,
+            f"You do not have permission to remove the model at {model_path}.",
+            "warning",
+        )
+    except OSError as e:
+        return False, f"Failed to remove the model at {model_path} // {e}.", "error"
 
-def remove_models_cli(**kwargs):
-    model_types_list = list(kwargs.get("TYPES").keys())
+    return (
+        True,
+        f"Model at {model_path} removed successfully. Freed up {model_size}",
+        "info",
+    )
 
-    console.print("Available model types for deletion:")
-    for index, model_type in enumerate(model_types_list, start=1):
-        console.print(f"{index}. {model_type}")
+
+def remove_model(model_path: str, model_size: Optional[str] = None) -> bool:
+    """Delete a model file and report the space freed."""
+    removed, message, message_type = delete_model_file(model_path, model_size)
+    feedback_message(message, message_type)
+    return removed
+
+
+def remove_models_cli(**kwargs):
+    console.print("Available model types for deletion:", MODEL_TYPES_MENU, sep="\n")
 
     model_type_index = typer.prompt(
         "Enter the number corresponding to the type of model you would like to delete"
     )
 
     try:
-        model_type = model_types_list[int(model_type_index) - 1]
+        model_type = TYPE_KEYS[int(model_type_index) - 1]
     except (IndexError, ValueError):
         feedback_message(
             f"Invalid selection. Please enter a valid number. // {str(ValueError)}",
@@ -169,11 +163,30 @@ def remove_models_cli(**kwargs):
             "This is a destructive operation and cannot be undone. Please proceed with caution.",
             "warning",
         )
+        model_names = ", ".join(model[0] for model in models_to_delete)
         confirmation = typer.confirm(
-            f"Are you sure you want to remove the model at {model[0]}? ", abort=True
+            f"Are you sure you want to remove {model_names}? ", abort=True
         )
         if confirmation:
-            for model in models_to_delete:
-                remove_model(model[2])
+            # Unlinking large files can block on the filesystem, so the
+            # removals run side by side
+            with ThreadPoolExecutor(max_workers=MAX_REMOVE_WORKERS) as executor:
+                results = list(
+                    executor.map(
+                        delete_model_file,
+                        [model[2] for model in models_to_delete],
+                        [model[3] for model in models_to_delete],
+                    )
+                )
+            # map keeps the selection order; reporting from the main thread
+            # keeps the output from interleaving between runs
+            for _, message, message_type in results:
+                feedback_message(message, message_type)
+            failed = sum(not removed for removed, _, _ in results)
+            if failed:
+                feedback_message(
+                    f"{failed} of {len(results)} models could not be removed.",
+                    "warning",
+                )
     else:
         console.print("No model selected for deletion.", style="bright_red")
@@ -4,15 +4,21 @@ import questionary
 import asyncio
 from enum import Enum
 from questionary import Style
-from typing import Any, Dict, List, Union, Optional
-from rich.console import Console
+from typing import Any, Dict, Iterable, List, Union, Optional
+from ._render import console
 from rich.text import Text
 from .helpers import create_table, feedback_message
-from .utils import clean_text, format_file_size
+from .utils import clean_text, format_file_size, json_loads
+from .session import new_async_session
+from .cache import (
+    load_cached,
+    is_fresh,
+    conditional_headers,
+    store_cached,
+    save_entry,
+)
 from tenacity import retry, stop_after_attempt, wait_exponential, RetryError
 
-console = Console(soft_wrap=True)
-
 
 class Types(Enum):
     Checkpoint = "Checkpoint"
@@ -38,7 +44,21 @@ class Periods(Enum):
     Day = "Day"
 
 
-__all__ = ["search_models", "search_cli", "search_cli_sync"]
+__all__ = ["search_models", "search_models_batch", "search_cli", "search_cli_sync"]
+
+SEARCH_DEFAULTS = {
+    "tag": None,
+    "types": "Checkpoint",
+    "limit": 2,
+    "sort": "Highest Rated",
+    "period": "AllTime",
+    "page": 1,
+}
+PERIODS = tuple(period.value for period in Periods)
+SORTS = tuple(sort.value for sort in Sorts)
+# Shared by every result row; rendering never modifies a Text
+NSFW_YES = Text("Yes", style="green")
+NSFW_NO = Text("No", style="bright_red")
 
 custom_style = Style(
     [
@@ -88,7 +108,7 @@ def pagination_menu(
     return None
 
 
-def validate_param(key: str, value: Any, valid_values: List[str]) -> bool:
+def validate_param(key: str, value: Any, valid_values: Iterable[str]) -> bool:
     if value not in valid_values and value is not None:
         feedback_message(
             f"\"{value}\" is not a valid {key}.\nPlease choose from: {', '.join(valid_values)}",
@@ -102,53 +122,89 @@ def validate_param(key: str, value: Any, valid_values: List[str]) -> bool:
 async def make_api_request(
     client: httpx.AsyncClient, url: str, params: Dict[str, Any]
 ) -> Dict[str, Any]:
-    response = await client.get(url, params=params, timeout=30)
+    """
+    Fetch a page of search results, served from the response cache when fresh.
+    """
+    request_url = str(client.build_request("GET", url, params=params).url)
+    cached = load_cached(request_url)
+    if is_fresh(cached):
+        return cached["body"]
+    response = await client.get(
+        request_url, headers=conditional_headers(cached), timeout=30
+    )
+    if response.status_code == 304 and cached:
+        save_entry(request_url, cached)
+        return cached["body"]
     response.raise_for_status()
-    return response.json()
+    data = json_loads(response.content)
+    store_cached(request_url, response, data)
+    return data
 
 
 async def search_models(
-    query: str = "", CIVITAI_MODELS=None, TYPES=None, **kwargs
+    query: str = "",
+    CIVITAI_MODELS=None,
+    TYPES=None,
+    client: Optional[httpx.AsyncClient] = None,
+    **kwargs,
 ) -> Dict[str, Any]:
-    allowed_params = {
-        "tag": None,
-        "types": "Checkpoint",
-        "limit": 2,
-        "sort": "Highest Rated",
-        "period": "AllTime",
-        "page": 1,
-    }
+    """
+    Search CivitAI for models.
+
+    :param client: A client to share with other searches; a new one is
+                   opened for this search when not given.
+    """
     params = {
-        **allowed_params,
-        **{k: v for k, v in kwargs.items() if k in allowed_params},
+        **SEARCH_DEFAULTS,
+        **{k: v for k, v in kwargs.items() if k in SEARCH_DEFAULTS},
     }
 
     if query:
         params["query"] = query
 
     validations = [
-        ("types", params.get("types"), TYPES.keys()),
-        ("period", params.get("period"), ["AllTime", "Year", "Month", "Week", "Day"]),
-        ("sort", params.get("sort"), ["Highest Rated", "Most Downloaded", "Newest"]),
+        ("types", params.get("types"), TYPES),
+        ("period", params.get("period"), PERIODS),
+        ("sort", params.get("sort"), SORTS),
     ]
 
     if not all(validate_param(*v) for v in validations):
         return {}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            return await make_api_request(client, CIVITAI_MODELS, params)
-        except RetryError:
-            feedback_message(
-                "Failed to connect to the API after multiple attempts.", "error"
+    if client is None:
+        async with new_async_session() as client:
+            return await search_models(query, CIVITAI_MODELS, TYPES, client, **kwargs)
+
+    try:
+        return await make_api_request(client, CIVITAI_MODELS, params)
+    except RetryError:
+        feedback_message(
+            "Failed to connect to the API after multiple attempts.", "error"
+        )
+        return {}
+    except httpx.HTTPStatusError as e:
+        feedback_message(f"HTTP error occurred: {e}", "error")
+        return {}
+    except Exception as e:
+        feedback_message(f"An unexpected error occurred: {e}", "error")
+        return {}
+
+
+async def search_models_batch(
+    queries: List[str], CIVITAI_MODELS=None, TYPES=None, **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run several searches concurrently over one pooled client.
+
+    :param queries: The search queries, results are returned in the same order.
+    """
+    async with new_async_session() as client:
+        return await asyncio.gather(
+            *(
+                search_models(query, CIVITAI_MODELS, TYPES, client, **kwargs)
+                for query in queries
             )
-            return {}
-        except httpx.HTTPStatusError as e:
-            feedback_message(f"HTTP error occurred: {e}", "error")
-            return {}
-        except Exception as e:
-            feedback_message(f"An unexpected error occurred: {e}", "error")
-            return {}
+        )
 
 
 async def search_cli(
@@ -166,7 +222,7 @@ async def search_cli(
     has_previous = False
     page_history = []
 
-    async with httpx.AsyncClient() as client:
+    async with new_async_session() as client:
         while True:
             with console.status("[yellow]Searching for models...", spinner="dots"):
                 try:
@@ -205,30 +261,20 @@ async def search_cli(
             )
 
             for model in models.get("items", []):
-                name = Text(
-                    clean_text(model["name"]), style="bold", overflow="ellipsis"
-                )
+                latest = model.get("modelVersions")[0]
+                # The name and size are interpolated into markup, so plain
+                # strings render exactly as the Text objects they replace
+                name = clean_text(model["name"])
+                size = format_file_size(latest["files"][0]["sizeKB"] * 1024)
                 tags = Text(
                     ", ".join(model["tags"]), style="italic", overflow="ellipsis"
                 )
-                size = Text(
-                    format_file_size(
-                        model.get("modelVersions")[0]["files"][0]["sizeKB"]
-                    ),
-                    style="yellow",
-                )
-                base = Text(model.get("modelVersions")[0]["baseModel"], style="yellow")
-                nsfw = (
-                    Text("Yes", style="green")
-                    if model["nsfw"]
-                    else Text("No", style="bright_red")
-                )
                 search_table.add_row(
                     str(model["id"]),
                     f"{name} // [yellow]{size}[/yellow]",
                     model["type"],
-                    base,
-                    nsfw,
+                    latest["baseModel"],  # the column is already yellow
+                    NSFW_YES if model["nsfw"] else NSFW_NO,
                     tags,
                 )
 
@@ -0,0 +1,97 @@
+import time
+import atexit
+import asyncio
+import httpx
+from importlib.util import find_spec
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+__all__ = ["get_session", "new_async_session"]
+
+TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+RETRIES = 3  # connection failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+BACKOFF = 0.3  # seconds, doubled per attempt
+MAX_RETRY_WAIT = 60  # seconds, caps a server's Retry-After
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2 = find_spec("h2") is not None
+
+
+def should_retry(request: httpx.Request, response: httpx.Response) -> bool:
+    return request.method in ("GET", "HEAD") and response.status_code in RETRY_STATUSES
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying, honouring the server's Retry-After.
+    """
+    retry_after = response.headers.get("retry-after", "")
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            delay = BACKOFF * 2**attempt
+    return min(max(delay, 0), MAX_RETRY_WAIT)
+
+
+class RetryTransport(httpx.HTTPTransport):
+    """Retry rate limits and gateway errors from CivitAI with backoff."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRIES):
+            response = super().handle_request(request)
+            if not should_retry(request, response):
+                return response
+            response.close()
+            time.sleep(retry_delay(response, attempt))
+        return super().handle_request(request)
+
+
+class AsyncRetryTransport(httpx.AsyncHTTPTransport):
+    """Async counterpart of RetryTransport."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRIES):
+            response = await super().handle_async_request(request)
+            if not should_retry(request, response):
+                return response
+            await response.aclose()
+            await asyncio.sleep(retry_delay(response, attempt))
+        return await super().handle_async_request(request)
+
+
+@lru_cache(maxsize=None)
+def get_session() -> httpx.Client:
+    """
+    Shared client so back to back CivitAI calls reuse pooled connections.
+
+    :return: The process wide HTTP client.
+    """
+    client = httpx.Client(
+        timeout=TIMEOUT,
+        transport=RetryTransport(retries=RETRIES, limits=LIMITS),
+    )
+    # Close pooled connections cleanly instead of leaving it to the GC
+    atexit.register(client.close)
+    return client
+
+
+def new_async_session(http2: bool = HTTP2, **kwargs) -> httpx.AsyncClient:
+    """
+    Async client with the shared pool and retry settings.
+
+    Async clients are bound to the event loop they are used in, so one is
+    created per asyncio.run rather than shared like get_session.
+
+    :param http2: Multiplex concurrent requests over one connection when h2
+                  is installed.
+    """
+    limits = kwargs.pop("limits", LIMITS)
+    kwargs.setdefault("timeout", TIMEOUT)
+    return httpx.AsyncClient(
+        transport=AsyncRetryTransport(retries=RETRIES, limits=limits, http2=http2),
+        **kwargs,
+    )
@@ -1,64 +1,83 @@
 import os
-from typing import Dict, Optional
-from collections import OrderedDict
-from rich.console import Console
+import heapq
+from typing import Dict, List, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from ._render import console as stats_console
 from .helpers import feedback_message, create_table
-from .utils import format_file_size
+from .utils import format_file_size, walk_model_files
+from civitai_models_manager import FILE_TYPES
 
 __all__ = [
     "inspect_models_cli",
 ]
 
-FILE_TYPES = (".safetensors", ".pt", ".pth", ".ckpt")
+MAX_SCAN_WORKERS = 16
 
-stats_console = Console(soft_wrap=True)
 
-
-def count_models(model_dir: str) -> Dict[str, int]:
+def scan_models(model_dir: str) -> List[Tuple[str, str, int]]:
     """
-    Count the number of models in the directory.
+    Walk the models directory once, collecting every model file.
+
+    Each top level directory is scanned in its own thread; on network shares
+    every readdir and stat is a round trip, and the GIL is released for both.
     :param model_dir: The directory of the models.
-    :return: The number of models in the directory.
+    :return: The top level directory, path and size in bytes of each model.
     """
-    model_counts = {}
-    for root, _, files in os.walk(model_dir):
-
-        top_level_dir = os.path.relpath(root, model_dir).split(os.sep)[0]
-        for file in files:
-            if file.endswith(FILE_TYPES):
-                if top_level_dir in model_counts:
-                    model_counts[top_level_dir] += 1
-                else:
-                    model_counts[top_level_dir] = 1
-    return model_counts
-
-
-def get_model_sizes(model_dir: str) -> Dict[str, str]:
-    model_sizes = {}
-    for root, _, files in os.walk(model_dir):
-        for file in files:
-            if file.endswith(FILE_TYPES):
-                model_path = os.path.join(root, file)
-                size_in_bytes = os.path.getsize(model_path)
-                size_str = format_file_size(size_in_bytes)
-
-                model_name = os.path.basename(file)
-                model_sizes[model_name] = size_str
-    return model_sizes
-
-
-# find model by file name on disk and return the path
-def find_model_by_name(model_dir: str, model_name: str) -> Optional[str]:
-    for root, _, files in os.walk(model_dir):
-        for file in files:
-            if file == model_name:
-                return os.path.join(root, file)
-    return None
+    models = []
+    subdirs = []
+    try:
+        with os.scandir(model_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(FILE_TYPES) and entry.is_file():
+                    models.append((".", entry.path, entry.stat().st_size))
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+    except OSError:
+        return models
+
+    def scan(subdir: os.DirEntry) -> List[Tuple[str, str, int]]:
+        return [
+            (subdir.name, entry.path, entry.stat().st_size)
+            for _, entry in walk_model_files(subdir.path, FILE_TYPES)
+        ]
+
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        for subdir_models in executor.map(scan, subdirs):
+            models.extend(subdir_models)
+    return models
+
+
+def count_models(models: List[Tuple[str, str, int]]) -> Dict[str, int]:
+    """
+    Count the number of models in each top level directory.
+    :param models: The models found by scan_models.
+    :return: The number of models per top level directory.
+    """
+    return dict(Counter(top_level_dir for top_level_dir, _, _ in models))
+
+
+def scan_directory(path: str) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    List the subdirectories of path and count the model files directly in it.
+    :param path: The directory to scan.
+    :return: The (name, path) of each subdirectory and the model file count.
+    """
+    subdirs = []
+    file_count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append((entry.name, entry.path))
+            elif entry.is_file() and entry.name.lower().endswith(FILE_TYPES):
+                file_count += 1
+    return subdirs, file_count
 
 
 def inspect_models_cli(MODELS_DIR: str) -> None:
     """Stats on the parent models directory."""
-    model_counts = count_models(MODELS_DIR)
+    models = scan_models(MODELS_DIR)
+    model_counts = count_models(models)
 
     if not model_counts:
         feedback_message("No models found.", "warning")
@@ -81,39 +100,18 @@ def inspect_models_cli(MODELS_DIR: str) -> None:
 
     for model_type, count in sorted(model_stats.items()):
         base_path = os.path.join(MODELS_DIR, model_type)
-        path_types = [
-            d
-            for d in os.listdir(base_path)
-            if os.path.isdir(os.path.join(base_path, d))
-        ]
+        subdirs, file_count = scan_directory(base_path)
 
-        if not path_types:
-            file_count = len(
-                [
-                    f
-                    for f in os.listdir(base_path)
-                    if os.path.isfile(os.path.join(base_path, f))
-                    and any(f.lower().endswith(ext) for ext in FILE_TYPES)
-                ]
-            )
+        if not subdirs:
             path_types_breakdown = (
                 f"[white]No subdirectories, {file_count} files[/white]"
             )
         else:
-            subdir_counts = {}
-            total_subdir_files = 0
-            for subdir in path_types:
-                subdir_path = os.path.join(base_path, subdir)
-                file_count = len(
-                    [
-                        f
-                        for f in os.listdir(subdir_path)
-                        if os.path.isfile(os.path.join(subdir_path, f))
-                        and any(f.lower().endswith(ext) for ext in FILE_TYPES)
-                    ]
-                )
-                subdir_counts[subdir] = file_count
-                total_subdir_files += file_count
+            subdir_counts = {
+                subdir: scan_directory(subdir_path)[1]
+                for subdir, subdir_path in subdirs
+            }
+            total_subdir_files = sum(subdir_counts.values())
 
             breakdown_parts = []
             for subdir, subdir_count in subdir_counts.items():
@@ -135,11 +133,6 @@ def inspect_models_cli(MODELS_DIR: str) -> None:
             f"{percentage:.2%}",
         )
 
-    stats_console.print(inspect_table)
-
-    # Get top 10 largest models
-    model_sizes = get_model_sizes(MODELS_DIR)
-
     largest_table = create_table(
         "",
         [
@@ -149,11 +142,10 @@ def inspect_models_cli(MODELS_DIR: str) -> None:
         ],
     )
 
-    for model_name, size in sorted(
-        model_sizes.items(), key=lambda x: float(x[1].split()[0]), reverse=True
-    )[:10]:
+    largest = heapq.nlargest(10, models, key=lambda model: model[2])
+    for _, model_path, size in largest:
         largest_table.add_row(
-            model_name, size, find_model_by_name(MODELS_DIR, model_name)
+            os.path.basename(model_path), format_file_size(size), model_path
         )
 
-    stats_console.print(largest_table)
+    stats_console.print(inspect_table, largest_table, sep="\n")
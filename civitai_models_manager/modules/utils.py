@@ -1,20 +1,26 @@
+import os
 from urllib.parse import urlparse, urlunparse, quote
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+try:
+    # Optional speedup: orjson decodes API responses several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+_WHITESPACE_TO_SPACE = str.maketrans("\n\r\t", "   ")
 
 
 def clean_text(text: str) -> str:
-    return text.replace("\n", " ").replace("\r", " ").replace("\t", " ").strip()
+    return text.translate(_WHITESPACE_TO_SPACE).strip()
 
 
 def format_file_size(size_bytes) -> str:
-
-    size_in_mb = size_bytes / (1024 * 1024)
-    size_in_gb = size_bytes / (1024 * 1024 * 1024)
-    return (
-        f"{size_in_mb:.2f} MB ({size_in_gb:.2f} GB)"
-        if size_in_gb >= 1
-        else f"{size_in_mb:.2f} MB"
-    )
+    size_in_mb = size_bytes / 1048576
+    if size_in_mb < 1024:
+        return f"{size_in_mb:.2f} MB"
+    return f"{size_in_mb:.2f} MB ({size_in_mb / 1024:.2f} GB)"
 
 
 def safe_get(collection, keys, default=None):
@@ -31,5 +37,39 @@ def safe_url(url: str) -> str:
     return urlunparse(parts._replace(path=quote(parts.path)))
 
 
+def read_id_file(path: str) -> List[str]:
+    """
+    Read model IDs from a file, one per line; blank lines and # comments are skipped.
+    :param path: The path of the ID file.
+    :return: The IDs in file order.
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
 def sort_models(models: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str]]:
     return sorted(models, key=lambda x: x[0])
+
+
+def walk_model_files(
+    root: str, file_types: Tuple[str, ...]
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (directory, entry) for every model file below root in one scandir pass.
+
+    Names are tested before anything else since most files next to models are
+    previews and metadata; the entry's stat is left to the caller.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(file_types) and entry.is_file():
+                        yield directory, entry
+                    elif entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
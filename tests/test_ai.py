@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from civitai_models_manager.modules import cache
+from civitai_models_manager.modules.ai import summarize_model_description
+
+OPTIONS = {
+    "model": "tinydolphin",
+    "temperature": "0.4",
+    "top_p": "0.3",
+    "system_template": "Summarize this model.",
+}
+MODEL = {"id": 1, "description": "<p>A model.</p>"}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "SUMMARY_DIR", tmp_path / "summaries")
+    monkeypatch.delenv("CIVITAI_CACHE_TTL", raising=False)
+    return tmp_path
+
+
+class OllamaClient:
+    """Streams a canned summary and counts the calls made."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat(self, **kwargs):
+        self.calls += 1
+        return iter([{"message": {"content": "A "}}, {"message": {"content": "summary."}}])
+
+
+def summarize(client, options=OPTIONS):
+    return "".join(summarize_model_description(MODEL, 1, "ollama", client, options))
+
+
+def test_summary_is_replayed_from_the_cache():
+    client = OllamaClient()
+    assert summarize(client) == "A summary."
+    assert summarize(client) == "A summary."
+    assert client.calls == 1
+
+
+def test_sampling_settings_are_part_of_the_key():
+    client = OllamaClient()
+    summarize(client)
+    summarize(client, {**OPTIONS, "temperature": "0.9"})
+    summarize(client, {**OPTIONS, "top_p": "0.9"})
+    assert client.calls == 3
+
+
+def test_no_cache_asks_the_service_again(monkeypatch):
+    client = OllamaClient()
+    summarize(client)
+    # Set by the root --no-cache flag
+    monkeypatch.setenv("CIVITAI_CACHE_TTL", "0")
+    summarize(client)
+    assert client.calls == 2
+
+
+def test_summaries_expire(cache_dir):
+    client = OllamaClient()
+    summarize(client)
+    for path in (cache_dir / "summaries").iterdir():
+        os.utime(path, (0, 0))
+    summarize(client)
+    assert client.calls == 2
+
+
+def test_failed_stream_is_not_cached(cache_dir):
+    class FailingClient(OllamaClient):
+        def chat(self, **kwargs):
+            self.calls += 1
+            yield {"message": {"content": "A "}}
+            raise ConnectionError("stream dropped")
+
+    summarize(FailingClient())
+    assert not (cache_dir / "summaries").exists()
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from civitai_models_manager.modules import cache
+from civitai_models_manager.modules.details import make_request_async
+
+URL = "https://civitai.com/api/v1/models/1"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.delenv("CIVITAI_CACHE_TTL", raising=False)
+    return tmp_path
+
+
+def test_is_fresh():
+    assert cache.is_fresh({"fetched_at": time.time()})
+    assert not cache.is_fresh({"fetched_at": time.time() - cache.MAX_AGE - 1})
+    assert not cache.is_fresh({"fetched_at": time.time()}, max_age=0)
+    assert not cache.is_fresh({})
+    assert not cache.is_fresh(None)
+
+
+def test_store_cached_requires_a_validator():
+    cache.store_cached(URL, httpx.Response(200), {"id": 1})
+    assert cache.load_cached(URL) is None
+
+    cache.store_cached(URL, httpx.Response(200, headers={"etag": '"v1"'}), {"id": 1})
+    entry = cache.load_cached(URL)
+    assert entry["body"] == {"id": 1}
+    assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+
+def test_store_cached_skips_errors():
+    cache.store_cached(URL, httpx.Response(500, headers={"etag": '"v1"'}), {})
+    assert cache.load_cached(URL) is None
+
+
+def test_failed_write_leaves_no_temp_file(cache_dir, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache.os, "replace", fail)
+    cache.store_cached(URL, httpx.Response(200, headers={"etag": '"v1"'}), {"id": 1})
+    assert os.listdir(cache_dir) == []
+
+
+def request(handler):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await make_request_async(client, URL)
+
+    return asyncio.run(run())
+
+
+def test_not_modified_reuses_cached_body():
+    cache.cache_path(URL).write_text(json.dumps({"etag": '"v1"', "body": {"id": 1}}))
+
+    def handler(request):
+        assert request.headers["if-none-match"] == '"v1"'
+        return httpx.Response(304)
+
+    assert request(handler) == {"id": 1}
+    # The 304 confirmed the entry, so it is trusted again for a while
+    assert cache.is_fresh(cache.load_cached(URL))
+
+
+def test_fresh_entry_skips_the_request():
+    cache.save_entry(URL, {"etag": '"v1"', "last_modified": None, "body": {"id": 1}})
+
+    def handler(request):
+        raise AssertionError("a fresh entry should not be revalidated")
+
+    assert request(handler) == {"id": 1}
+
+
+def test_response_is_cached():
+    def handler(request):
+        return httpx.Response(200, headers={"etag": '"v2"'}, json={"id": 2})
+
+    assert request(handler) == {"id": 2}
+    assert cache.load_cached(URL)["body"] == {"id": 2}
@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+
+from civitai_models_manager.modules import cache
+from civitai_models_manager.modules.details import get_model_details_async
+
+MODELS = "https://civitai.com/api/v1/models"
+VERSIONS = "https://civitai.com/api/v1/model-versions"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+
+
+def details(handler, model_id):
+    requested = []
+
+    def record(request):
+        requested.append(str(request.url))
+        return handler(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(record)) as client:
+            return await get_model_details_async(client, MODELS, VERSIONS, model_id)
+
+    return asyncio.run(run()), requested
+
+
+def test_model_id_costs_one_request():
+    def handler(request):
+        return httpx.Response(200, json={"id": 1, "name": "Model"})
+
+    model, requested = details(handler, 1)
+    assert model["name"] == "Model"
+    assert requested == [f"{MODELS}/1"]
+
+
+def test_version_id_falls_back_after_404():
+    def handler(request):
+        if request.url.path == "/api/v1/models/2":
+            return httpx.Response(404, json={"error": "No model with id 2"})
+        if request.url.path == "/api/v1/model-versions/2":
+            return httpx.Response(200, json={"id": 2, "modelId": 1, "model": {}})
+        return httpx.Response(200, json={"id": 1, "name": "Parent"})
+
+    model, requested = details(handler, 2)
+    assert model["name"] == "Parent"
+    assert requested == [f"{MODELS}/2", f"{VERSIONS}/2", f"{MODELS}/1"]
+
+
+def test_404_without_json_body_is_not_found():
+    def handler(request):
+        return httpx.Response(404, text="Not Found")
+
+    model, requested = details(handler, 3)
+    assert model == {}
+    assert requested == [f"{MODELS}/3", f"{VERSIONS}/3"]
+
+
+def test_server_error_is_reported_not_raised():
+    def handler(request):
+        return httpx.Response(500)
+
+    model, _ = details(handler, 4)
+    assert model == {}
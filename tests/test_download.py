@@ -0,0 +1,260 @@
+import asyncio
+
+import httpx
+import pytest
+import typer
+from rich.progress import Progress
+
+from civitai_models_manager.modules import download
+from civitai_models_manager.modules.download import (
+    _download_file_async,
+    check_for_upgrade,
+    download_segment,
+    get_chunk_size,
+    get_validator,
+    is_complete,
+    load_resume_state,
+    plan_segments,
+    probe_download,
+    save_resume_state,
+)
+
+URL = "https://civitai.com/api/download/models/1"
+BLOB = bytes(range(256)) * 16
+
+
+def probe(handler):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await probe_download(client, URL)
+
+    return asyncio.run(run())
+
+
+def test_probe_uses_head():
+    def handler(request):
+        assert request.method == "HEAD"
+        return httpx.Response(
+            200,
+            headers={
+                "content-length": str(len(BLOB)),
+                "accept-ranges": "bytes",
+                "etag": '"v1"',
+            },
+        )
+
+    assert probe(handler) == (URL, len(BLOB), True, '"v1"')
+
+
+def test_probe_falls_back_when_head_is_blocked():
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        assert request.headers["range"] == "bytes=0-0"
+        return httpx.Response(
+            206,
+            headers={"content-range": f"bytes 0-0/{len(BLOB)}", "etag": '"v1"'},
+            content=BLOB[:1],
+        )
+
+    assert probe(handler) == (URL, len(BLOB), True, '"v1"')
+
+
+def test_probe_without_range_support():
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, content=BLOB)
+
+    assert probe(handler) == (URL, len(BLOB), False, "")
+
+
+def test_get_validator_prefers_a_strong_etag():
+    modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert get_validator(httpx.Headers({"etag": '"v1"'})) == '"v1"'
+    # Weak ETags are not allowed in If-Range
+    headers = httpx.Headers({"etag": 'W/"v1"', "last-modified": modified})
+    assert get_validator(headers) == modified
+    assert get_validator(httpx.Headers()) == ""
+
+
+def run_segment(handler, path, segment, validator=""):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with Progress(disable=True) as progress:
+                task = progress.add_task("test", total=len(BLOB))
+                await download_segment(
+                    client, URL, path, segment, progress, task, validator
+                )
+                return progress.tasks[0].completed
+
+    return asyncio.run(run())
+
+
+def ranged(request):
+    start, end = request.headers["range"][6:].split("-")
+    return httpx.Response(
+        206,
+        headers={"content-range": f"bytes {start}-{end}/{len(BLOB)}"},
+        # A stream, so the body is read in chunks like a download
+        stream=httpx.ByteStream(BLOB[int(start) : int(end) + 1]),
+    )
+
+
+@pytest.fixture
+def part_file(tmp_path):
+    path = str(tmp_path / "model.safetensors.part")
+    with open(path, "wb") as f:
+        f.truncate(len(BLOB))
+    return path
+
+
+def test_download_segment_resumes_after_written_bytes(part_file):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["range"])
+        return ranged(request)
+
+    segment = [1024, 2047, 24]
+    assert run_segment(handler, part_file, segment) == 1000
+    assert seen == ["bytes=1048-2047"]
+    assert segment == [1024, 2047, 1024]
+    with open(part_file, "rb") as f:
+        f.seek(1048)
+        assert f.read(1000) == BLOB[1048:2048]
+
+
+def test_download_segment_sends_if_range(part_file):
+    def handler(request):
+        assert request.headers["if-range"] == '"v1"'
+        return ranged(request)
+
+    assert run_segment(handler, part_file, [0, 1023, 0], '"v1"') == 1024
+
+
+def test_download_segment_rejects_a_changed_file(part_file):
+    def handler(request):
+        # The file changed upstream, so If-Range sends the whole new body
+        return httpx.Response(200, stream=httpx.ByteStream(BLOB))
+
+    with pytest.raises(httpx.RequestError):
+        run_segment(handler, part_file, [1024, 2047, 24], '"v1"')
+    with open(part_file, "rb") as f:
+        assert f.read() == bytes(len(BLOB))
+
+
+def test_download_segment_skips_finished_ranges(part_file):
+    def handler(request):
+        raise AssertionError("a finished segment should not be requested")
+
+    assert run_segment(handler, part_file, [0, 1023, 1024]) == 0
+
+
+def test_short_download_is_not_finished(tmp_path, monkeypatch):
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(
+                200,
+                headers={
+                    "content-length": str(len(BLOB)),
+                    "accept-ranges": "bytes",
+                    "etag": '"v1"',
+                },
+            )
+        start, end = request.headers["range"][6:].split("-")
+        # The connection drops ten bytes before the end of the range
+        return httpx.Response(
+            206,
+            headers={"content-range": f"bytes {start}-{end}/{len(BLOB)}"},
+            stream=httpx.ByteStream(BLOB[int(start) : int(end) - 9]),
+        )
+
+    def session(http2=False, limits=None, **kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(download, "new_async_session", session)
+    path = str(tmp_path / "model.safetensors.part")
+
+    async def run():
+        with Progress(disable=True) as progress:
+            task = progress.add_task("test")
+            await _download_file_async(URL, path, progress, task)
+
+    with pytest.raises(httpx.RequestError, match="Received"):
+        asyncio.run(run())
+    # The progress is kept so the next attempt resumes the missing bytes
+    segments = load_resume_state(path, len(BLOB), '"v1"')
+    assert sum(written for _, _, written in segments) == len(BLOB) - 10
+
+
+def test_plan_segments_splits_large_files():
+    total = 8 * download.CHUNK_SIZE + 3
+    segments = plan_segments(total, 4)
+    assert len(segments) == 4
+    assert segments[0][0] == 0
+    assert segments[-1][1] == total - 1
+    # The ranges are contiguous and none has been written yet
+    for previous, current in zip(segments, segments[1:]):
+        assert current[0] == previous[1] + 1
+    assert all(written == 0 for _, _, written in segments)
+
+
+def test_plan_segments_keeps_small_files_whole():
+    assert plan_segments(100, 4) == [[0, 99, 0]]
+
+
+def test_resume_state_round_trip(part_file):
+    segments = [[0, 2047, 10], [2048, 4095, 0]]
+    save_resume_state(part_file, len(BLOB), '"v1"', segments)
+
+    assert load_resume_state(part_file, len(BLOB), '"v1"') == segments
+    # A different size or validator upstream discards the saved progress
+    assert load_resume_state(part_file, len(BLOB) + 1, '"v1"') is None
+    assert load_resume_state(part_file, len(BLOB), '"v2"') is None
+
+
+def test_resume_state_missing(tmp_path):
+    assert load_resume_state(str(tmp_path / "missing.part"), 100, "") is None
+
+
+def test_is_complete(part_file):
+    assert is_complete(part_file, len(BLOB))
+    # sizeKB is rounded, so a kilobyte either way still matches
+    assert is_complete(part_file, len(BLOB) + 1000)
+    assert not is_complete(part_file, len(BLOB) * 2)
+    assert is_complete(part_file, 0)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", download.DEFAULT_CHUNK_SIZE),
+        ("4194304", 4194304),
+        ("1", download.MIN_CHUNK_SIZE),
+        ("0", download.DEFAULT_CHUNK_SIZE),
+        ("-1", download.DEFAULT_CHUNK_SIZE),
+        ("1MB", download.DEFAULT_CHUNK_SIZE),
+    ],
+)
+def test_get_chunk_size(monkeypatch, value, expected):
+    monkeypatch.setenv("DOWNLOAD_CHUNK_SIZE", value)
+    assert get_chunk_size() == expected
+
+
+@pytest.fixture
+def no_prompt(monkeypatch):
+    def confirm(*args, **kwargs):
+        raise AssertionError("the upgrade should not be prompted for")
+
+    monkeypatch.setattr(typer, "confirm", confirm)
+
+
+VERSIONS = [{"file": "model-v2.safetensors"}, {"file": "model-v1.safetensors"}]
+
+
+@pytest.mark.parametrize("yes", [False, True])
+def test_no_upgrade_when_selected_version_is_on_disk(no_prompt, yes):
+    path = "/models/checkpoints/model-v1.safetensors"
+    assert not check_for_upgrade(VERSIONS, path, VERSIONS[1], yes)
+
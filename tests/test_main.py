@@ -1,6 +1,8 @@
 import pytest
 from typer.testing import CliRunner
+import civitai_models_manager
 from civitai_models_manager.cli import civitai_cli
+from civitai_models_manager.modules import download
 
 
 @pytest.fixture
@@ -37,3 +39,40 @@ def test_invalid_command(runner):
     # print(f"Output: {result.stdout}")
     assert result.exit_code == 2
     assert "No such command 'nonexistent-command'." in result.stdout
+
+
+def test_bare_invocation_shows_help(runner):
+    result = runner.invoke(civitai_cli, [])
+    assert result.exit_code == 0
+    assert "Usage" in result.stdout
+
+
+@pytest.fixture
+def downloads(tmp_path, monkeypatch):
+    """Record the IDs handed to the downloader instead of downloading."""
+    requested = []
+    monkeypatch.setattr(civitai_models_manager, "MODELS_DIR", str(tmp_path), raising=False)
+    monkeypatch.setattr(civitai_models_manager, "CIVITAI_TOKEN", "token", raising=False)
+    monkeypatch.setattr(
+        download,
+        "download_model_cli",
+        lambda identifiers, *args, **kwargs: requested.extend(identifiers),
+    )
+    return requested
+
+
+def test_download_from_file(runner, downloads, tmp_path):
+    id_file = tmp_path / "ids.txt"
+    id_file.write_text("12345\n# skipped\n54321\n")
+    result = runner.invoke(civitai_cli, ["download", "12345", "--file", str(id_file)])
+    assert result.exit_code == 0
+    # IDs given on the command line and in the file are downloaded once
+    assert downloads == ["12345", "54321"]
+
+
+def test_download_from_missing_file(runner, downloads, tmp_path):
+    result = runner.invoke(
+        civitai_cli, ["download", "--file", str(tmp_path / "missing.txt")]
+    )
+    assert result.exit_code == 1
+    assert downloads == []
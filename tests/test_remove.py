@@ -0,0 +1,66 @@
+import os
+import time
+
+from civitai_models_manager.modules import remove
+from civitai_models_manager.modules.remove import remove_model, remove_models_cli
+
+
+def test_remove_model(tmp_path):
+    model = tmp_path / "model.safetensors"
+    model.write_bytes(b"\0" * 1024)
+    assert remove_model(str(model))
+    assert not model.exists()
+
+
+def test_remove_missing_model(tmp_path):
+    assert not remove_model(str(tmp_path / "missing.safetensors"))
+
+
+def test_remove_model_without_permission(tmp_path, monkeypatch):
+    model = tmp_path / "model.safetensors"
+    model.write_bytes(b"\0")
+
+    def deny(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(remove.os, "remove", deny)
+    assert not remove_model(str(model))
+    assert os.path.exists(model)
+
+
+def test_remove_models_reports_in_selection_order(tmp_path, monkeypatch):
+    folder = tmp_path / "checkpoints"
+    folder.mkdir()
+    for name in ("a", "b", "c"):
+        (folder / f"{name}.safetensors").write_bytes(b"\0")
+    messages = []
+    unlink = os.remove
+
+    def slow_first(path):
+        # The first removal finishes last, so reporting from the workers
+        # would print it last
+        if path.endswith("a.safetensors"):
+            time.sleep(0.2)
+        unlink(path)
+
+    monkeypatch.setattr(remove.typer, "prompt", lambda *args, **kwargs: "1")
+    monkeypatch.setattr(remove.typer, "confirm", lambda *args, **kwargs: True)
+    monkeypatch.setattr(remove, "select_models_to_delete", lambda models: models)
+    monkeypatch.setattr(remove.os, "remove", slow_first)
+    monkeypatch.setattr(
+        remove, "feedback_message", lambda message, type="info": messages.append(message)
+    )
+
+    remove_models_cli(
+        TYPES={"Checkpoint": "checkpoints"},
+        MODELS_DIR=str(tmp_path),
+        FILE_TYPES=[".safetensors"],
+    )
+
+    removed = [message for message in messages if "removed successfully" in message]
+    assert [os.path.basename(message.split()[2]) for message in removed] == [
+        "a.safetensors",
+        "b.safetensors",
+        "c.safetensors",
+    ]
+    assert os.listdir(folder) == []
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from civitai_models_manager.modules import session
+from civitai_models_manager.modules.session import (
+    AsyncRetryTransport,
+    RetryTransport,
+    retry_delay,
+    should_retry,
+)
+
+URL = "https://civitai.com/api/v1/models/1"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(session, "BACKOFF", 0)
+
+
+def replies(monkeypatch, *statuses):
+    """Answer the transports' requests with statuses, in order."""
+    statuses = iter(statuses)
+    calls = []
+
+    def handle(self, request):
+        calls.append(request)
+        return httpx.Response(next(statuses))
+
+    async def handle_async(self, request):
+        return handle(self, request)
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle)
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", handle_async)
+    return calls
+
+
+def test_retries_rate_limits_and_gateway_errors(monkeypatch):
+    calls = replies(monkeypatch, 502, 429, 200)
+    with httpx.Client(transport=RetryTransport()) as client:
+        assert client.get(URL).status_code == 200
+    assert len(calls) == 3
+
+
+def test_gives_up_after_retries(monkeypatch):
+    calls = replies(monkeypatch, *[504] * (session.RETRIES + 1))
+    with httpx.Client(transport=RetryTransport()) as client:
+        assert client.get(URL).status_code == 504
+    assert len(calls) == session.RETRIES + 1
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    calls = replies(monkeypatch, 404)
+    with httpx.Client(transport=RetryTransport()) as client:
+        assert client.get(URL).status_code == 404
+    assert len(calls) == 1
+
+
+def test_async_transport_retries(monkeypatch):
+    calls = replies(monkeypatch, 503, 200)
+
+    async def run():
+        async with httpx.AsyncClient(transport=AsyncRetryTransport()) as client:
+            return await client.get(URL)
+
+    assert asyncio.run(run()).status_code == 200
+    assert len(calls) == 2
+
+
+def response(status=429, **headers):
+    return httpx.Response(status, headers=headers)
+
+
+def test_retry_delay_seconds():
+    assert retry_delay(response(**{"retry-after": "2"}), 0) == 2
+
+
+def test_retry_delay_http_date():
+    date = formatdate(time.time() + 10, usegmt=True)
+    assert 8 <= retry_delay(response(**{"retry-after": date}), 0) <= 10
+
+
+def test_retry_delay_is_capped():
+    assert retry_delay(response(**{"retry-after": "3600"}), 0) == session.MAX_RETRY_WAIT
+    assert retry_delay(response(**{"retry-after": "-5"}), 0) == 0
+
+
+@pytest.mark.parametrize("retry_after", ["", "soon"])
+def test_retry_delay_backs_off(monkeypatch, retry_after):
+    monkeypatch.setattr(session, "BACKOFF", 0.3)
+    for attempt in range(3):
+        delay = retry_delay(response(**{"retry-after": retry_after}), attempt)
+        assert delay == pytest.approx(0.3 * 2**attempt)
+
+
+def test_should_retry():
+    get = httpx.Request("GET", URL)
+    assert should_retry(get, response(429))
+    assert should_retry(get, response(500))
+    assert not should_retry(get, response(404))
+    # Only idempotent requests are replayed
+    assert not should_retry(httpx.Request("POST", URL), response(429))
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from civitai_models_manager.modules.stats import (
+    count_models,
+    inspect_models_cli,
+    scan_models,
+)
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    """A models tree with twelve checkpoints and two LoRAs, one nested."""
+    for i in range(12):
+        path = tmp_path / "checkpoints" / f"model-{i:02}.safetensors"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"\0" * (i + 1) * 100)
+    (tmp_path / "checkpoints" / "model-00.preview.png").write_bytes(b"\0")
+    (tmp_path / "loras" / "sdxl").mkdir(parents=True)
+    (tmp_path / "loras" / "style.safetensors").write_bytes(b"\0" * 10)
+    (tmp_path / "loras" / "sdxl" / "detail.safetensors").write_bytes(b"\0" * 20)
+    return tmp_path
+
+
+def test_scan_models(models_dir):
+    models = scan_models(str(models_dir))
+    assert len(models) == 14
+    # Nested models count towards their top level directory
+    detail = str(models_dir / "loras" / "sdxl" / "detail.safetensors")
+    assert ("loras", detail, 20) in models
+    assert count_models(models) == {"checkpoints": 12, "loras": 2}
+
+
+def test_scan_models_missing_dir(tmp_path):
+    assert scan_models(str(tmp_path / "missing")) == []
+
+
+def test_largest_models(models_dir, capsys):
+    inspect_models_cli(str(models_dir))
+    output = capsys.readouterr().out
+    # Only the ten largest are listed, largest first
+    listed = [f"model-{i:02}.safetensors" for i in range(11, 1, -1)]
+    positions = [output.index(name) for name in listed]
+    assert positions == sorted(positions)
+    assert "model-01.safetensors" not in output
+    assert "style.safetensors" not in output
@@ -0,0 +1,19 @@
+import httpx
+
+from civitai_models_manager.modules.tools import check_api_availability
+
+
+def test_api_check_is_not_retried(monkeypatch):
+    calls = []
+
+    def handle(self, request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle)
+    result = check_api_availability()
+    assert not result["status"]
+    assert "503" in result["message"]
+    # A single probe, so the check is bounded by its own timeout
+    assert len(calls) == 1
+    assert calls[0].url.params["limit"] == "1"
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from civitai_models_manager.modules.list import list_models
+from civitai_models_manager.modules.utils import (
+    format_file_size,
+    read_id_file,
+    walk_model_files,
+)
+
+
+@pytest.mark.parametrize(
+    "size_bytes, expected",
+    [
+        (0, "0.00 MB"),
+        (524288, "0.50 MB"),
+        (1048576, "1.00 MB"),
+        (1023 * 1048576, "1023.00 MB"),
+        (1 << 30, "1024.00 MB (1.00 GB)"),
+        (6938040682, "6616.63 MB (6.46 GB)"),
+    ],
+)
+def test_format_file_size(size_bytes, expected):
+    assert format_file_size(size_bytes) == expected
+
+
+def test_format_file_size_from_kb():
+    # CivitAI reports sizeKB; callers convert to bytes first
+    assert format_file_size(2082642.68 * 1024) == "2033.83 MB (1.99 GB)"
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    (tmp_path / "sdxl" / "styles").mkdir(parents=True)
+    (tmp_path / "base.safetensors").write_bytes(b"\0" * 10)
+    (tmp_path / "base.preview.png").write_bytes(b"\0")
+    (tmp_path / "sdxl" / "detail.ckpt").write_bytes(b"\0" * 20)
+    (tmp_path / "sdxl" / "styles" / "ink.safetensors").write_bytes(b"\0" * 30)
+    # A directory named like a model is walked, not yielded
+    (tmp_path / "folder.safetensors").mkdir()
+    return tmp_path
+
+
+def test_walk_model_files(models_dir):
+    found = {
+        (os.path.relpath(directory, models_dir), entry.name, entry.stat().st_size)
+        for directory, entry in walk_model_files(
+            str(models_dir), (".safetensors", ".ckpt")
+        )
+    }
+    assert found == {
+        (".", "base.safetensors", 10),
+        ("sdxl", "detail.ckpt", 20),
+        (os.path.join("sdxl", "styles"), "ink.safetensors", 30),
+    }
+
+
+def test_walk_model_files_missing_dir(tmp_path):
+    assert list(walk_model_files(str(tmp_path / "missing"), (".ckpt",))) == []
+
+
+def test_list_models(models_dir):
+    models = list_models(str(models_dir), [".safetensors"])
+    assert [model[0] for model in models] == ["base", "ink"]
+    assert models[1][1] == "styles"
+    assert models[1][2] == str(models_dir / "sdxl" / "styles" / "ink.safetensors")
+
+
+def test_read_id_file(tmp_path):
+    id_file = tmp_path / "ids.txt"
+    id_file.write_text("# favourites\n12345\n\n  54321  # sdxl\n67890\n")
+    assert read_id_file(str(id_file)) == ["12345", "54321", "67890"]